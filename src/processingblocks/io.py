@@ -17,19 +17,21 @@ import asyncio
 import collections
 import multiprocessing
 import multiprocessing.connection
-from multiprocessing import Process, Pool, Lock, Event, Queue, Pipe, Condition
+from multiprocessing import Process, Pool, Lock, Event, Queue, Pipe, Condition, Value
 from multiprocessing import context
+from multiprocessing import shared_memory
 import os
 import queue
 import warnings
 import socket
 import socketserver
+import struct
 import sys
 import threading
 import time
 
 # Downloaded Libraries #
-from baseobjects import BaseObject
+from baseobjects import BaseObject, TimeoutWarning
 
 # Local Libraries #
 
@@ -152,13 +154,13 @@ class SimpleQueue(BaseObject):
         return self._writer
 
     def get(self, block=True, timeout=None):
-        if self._rlock.aqcuire(block, timeout):
+        if self._rlock.acquire(block, timeout):
             try:
                 res = self._reader.recv_bytes()
             finally:
                 self._rlock.release()
         else:
-            warnings.warn()
+            warnings.warn(TimeoutWarning("'get'"), stacklevel=2)
             return None
 
         # unserialize the data after having released the lock
@@ -167,14 +169,14 @@ class SimpleQueue(BaseObject):
     async def get_async(self, timeout=None, interval=0.0):
         start_time = time.perf_counter()
         while True:
-            if self._rlock.aqcuire(block=False):
+            if self._rlock.acquire(block=False):
                 try:
                     res = self._reader.recv_bytes()
                 finally:
                     self._rlock.release()
                     break
             if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                warnings.warn()
+                warnings.warn(TimeoutWarning("'get_async'"), stacklevel=2)
                 return None
             await asyncio.sleep(interval)
 
@@ -194,7 +196,7 @@ class SimpleQueue(BaseObject):
                 finally:
                     self._wlock.release()
             else:
-                warnings.warn()
+                warnings.warn(TimeoutWarning("'put'"), stacklevel=2)
 
     async def put_async(self, obj, timeout=None, interval=0.0):
         start_time = time.perf_counter()
@@ -212,7 +214,7 @@ class SimpleQueue(BaseObject):
                         self._wlock.release()
                         break
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'put_async'"), stacklevel=2)
                     return None
                 await asyncio.sleep(interval)
 
@@ -221,6 +223,315 @@ class SimpleQueue(BaseObject):
         self._writer.close()
 
 
+class LocalQueue(BaseObject):
+    """A thin wrapper on asyncio.Queue for handoff between tasks sharing one event loop.
+
+    The cross-process queues pay a lock and usually a thread hop per item; when producer and consumer
+    run on the same event loop an asyncio.Queue turns the handoff into a couple of loop callbacks.
+    The wrapper follows the Queue API the handlers expect, so it registers through add_queue, but it
+    cannot cross a process boundary and does not pickle. The synchronous put and get never block;
+    waiting belongs on the loop through put_async and get_async.
+
+    Args:
+        maxsize (int, optional): The most items the queue will hold, zero for unbounded.
+    """
+    # Construction/Destruction
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self._queue = None
+
+    def _get_queue(self):
+        """Creates the backing queue on first use so it binds to the loop the tasks run on.
+
+        On Python 3.8/3.9 asyncio primitives bind the event loop at construction, and this object
+        may be constructed before the loop that will use it is running.
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        return self._queue
+
+    # Object Query
+    def qsize(self):
+        return 0 if self._queue is None else self._queue.qsize()
+
+    def empty(self):
+        return self._queue is None or self._queue.empty()
+
+    def full(self):
+        return self._queue is not None and self._queue.full()
+
+    # Transmission
+    def put(self, obj, block=False, timeout=None):
+        """Puts an item without blocking, raising queue.Full when the queue is at maxsize.
+
+        The block and timeout parameters keep the signature the handlers call with, but blocking on
+        the loop thread would starve the consumer, so a blocking request is refused; put_async is
+        the waiting path.
+
+        Raises:
+            ValueError: If block is True, this queue cannot block.
+        """
+        if block:
+            raise ValueError("LocalQueue cannot block, use put_async to wait")
+        try:
+            self._get_queue().put_nowait(obj)
+        except asyncio.QueueFull:
+            raise queue.Full
+
+    async def put_async(self, obj):
+        await self._get_queue().put(obj)
+
+    def get(self, block=False, timeout=None):
+        """Gets an item without blocking, raising queue.Empty when there is none.
+
+        The block and timeout parameters keep the signature the handlers call with, but blocking on
+        the loop thread would starve the producer, so a blocking request is refused; get_async is
+        the waiting path.
+
+        Raises:
+            ValueError: If block is True, this queue cannot block.
+        """
+        if block:
+            raise ValueError("LocalQueue cannot block, use get_async to wait")
+        try:
+            return self._get_queue().get_nowait()
+        except asyncio.QueueEmpty:
+            raise queue.Empty
+
+    async def get_async(self, timeout=None, interval=0.0):
+        try:
+            if timeout is None:
+                return await self._get_queue().get()
+            return await asyncio.wait_for(self._get_queue().get(), timeout)
+        except asyncio.TimeoutError:
+            warnings.warn(TimeoutWarning("'get_async'"), stacklevel=2)
+            return None
+
+
+class SharedMemoryQueue(BaseObject):
+    """A cross-process queue backed by a shared memory ring buffer.
+
+    Items live in fixed size slots of a SharedMemory block guarded by head and tail cursors, so passing
+    an item between processes is a memory copy with no pipe write or per-item pickle for numeric items.
+    Integers and floats are struct packed straight into their slot; any other item is pickled into the
+    slot instead. Every process attaches to the same block, the cursors and condition are inherited.
+
+    Attributes:
+        slots (int): The number of item slots in the ring buffer.
+        slot_size (int): The size of each slot in bytes, including the slot header.
+
+    Args:
+        name (str, optional): The name of an existing SharedMemory block to attach to.
+        slots (int, optional): The number of item slots to allocate.
+        slot_size (int, optional): The size of each slot in bytes.
+        init (bool, optional): Determines if this object should be initialized.
+    """
+    _HEADER = struct.Struct("<Bi")  # kind, payload length
+    _INT = struct.Struct("<q")
+    _FLOAT = struct.Struct("<d")
+    _RAW_KIND = 0
+    _INT_KIND = 1
+    _FLOAT_KIND = 2
+
+    # Construction/Destruction
+    def __init__(self, name=None, slots=1024, slot_size=64, init=True):
+        self.slots = slots
+        self.slot_size = slot_size
+        self._shm = None
+        self._head = Value("L", 0)
+        self._tail = Value("L", 0)
+        self._condition = Condition()
+
+        if init:
+            self.construct(name)
+
+    # Pickling
+    def __getstate__(self):
+        out_dict = self.__dict__.copy()
+        out_dict["_shm"] = self._shm.name
+        return out_dict
+
+    def __setstate__(self, in_dict):
+        in_dict["_shm"] = shared_memory.SharedMemory(name=in_dict["_shm"])
+        self.__dict__ = in_dict
+
+    # Constructors/Destructors
+    def construct(self, name=None):
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=self.slots * self.slot_size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+
+    # Object Query
+    def qsize(self):
+        with self._condition:
+            return self._tail.value - self._head.value
+
+    def empty(self):
+        return self._tail.value == self._head.value
+
+    def full(self):
+        return self._tail.value - self._head.value >= self.slots
+
+    # Slot Access
+    def _write_slot(self, obj):
+        offset = (self._tail.value % self.slots) * self.slot_size
+        if isinstance(obj, int) and -2 ** 63 <= obj < 2 ** 63:
+            kind, payload = self._INT_KIND, self._INT.pack(obj)
+        elif isinstance(obj, float):
+            kind, payload = self._FLOAT_KIND, self._FLOAT.pack(obj)
+        else:
+            kind, payload = self._RAW_KIND, bytes(context.reduction.ForkingPickler.dumps(obj))
+        if len(payload) > self.slot_size - self._HEADER.size:
+            raise ValueError("the item does not fit in a slot of this queue")
+        self._HEADER.pack_into(self._shm.buf, offset, kind, len(payload))
+        self._shm.buf[offset + self._HEADER.size:offset + self._HEADER.size + len(payload)] = payload
+        self._tail.value += 1
+
+    def _read_slot(self):
+        offset = (self._head.value % self.slots) * self.slot_size
+        kind, length = self._HEADER.unpack_from(self._shm.buf, offset)
+        payload = self._shm.buf[offset + self._HEADER.size:offset + self._HEADER.size + length]
+        if kind == self._INT_KIND:
+            obj = self._INT.unpack(payload)[0]
+        elif kind == self._FLOAT_KIND:
+            obj = self._FLOAT.unpack(payload)[0]
+        else:
+            obj = context.reduction.ForkingPickler.loads(payload)
+        self._head.value += 1
+        return obj
+
+    # Transmission
+    def put(self, obj, block=True, timeout=None):
+        with self._condition:
+            if self.full():
+                if not block or not self._condition.wait_for(lambda: not self.full(), timeout):
+                    raise queue.Full
+            self._write_slot(obj)
+            self._condition.notify_all()
+
+    def get(self, block=True, timeout=None):
+        with self._condition:
+            if self.empty():
+                if not block or not self._condition.wait_for(lambda: not self.empty(), timeout):
+                    raise queue.Empty
+            obj = self._read_slot()
+            self._condition.notify_all()
+        return obj
+
+    async def get_async(self, timeout=None, interval=0.0):
+        start_time = time.perf_counter()
+        while True:
+            try:
+                return self.get(block=False)
+            except queue.Empty:
+                if timeout is not None and (time.perf_counter() - start_time) >= timeout:
+                    warnings.warn(TimeoutWarning("'get_async'"), stacklevel=2)
+                    return None
+                await asyncio.sleep(interval)
+
+    def close(self):
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
+
+
+class BufferedQueue(BaseObject):
+    """A bounded elastic buffer in front of an upstream queue.
+
+    A forwarder coroutine drains the upstream queue into a local asyncio.Queue holding up to maxsize
+    items, so the producing stage keeps filling while the consuming stage is busy with earlier items
+    and the stages decouple up to the buffer depth. The forwarder starts lazily on the consumer's
+    running loop the first time the buffer is read, so construction needs no loop. Follows the Queue
+    API the handlers expect and registers through add_queue, but the buffered side must be consumed
+    from the loop that started the forwarder.
+
+    Args:
+        upstream: The queue to drain, anything following the handlers' Queue API.
+        maxsize (int, optional): The most items buffered ahead of the consumer.
+        interval (float, optional): The time between upstream polls while it is empty.
+    """
+    # Construction/Destruction
+    def __init__(self, upstream, maxsize=16, interval=0.0):
+        self.upstream = upstream
+        self.maxsize = maxsize
+        self.interval = interval
+        self._buffer = None
+        self._forwarder = None
+
+    def _get_buffer(self):
+        """Creates the buffer on first use so it binds to the loop the forwarder runs on.
+
+        On Python 3.8/3.9 asyncio primitives bind the event loop at construction, and this object
+        may be constructed before the consumer's loop is running.
+        """
+        if self._buffer is None:
+            self._buffer = asyncio.Queue(maxsize=self.maxsize)
+        return self._buffer
+
+    # Forwarding
+    def _ensure_forwarder(self):
+        """Starts the forwarder task on the running loop if it is not already running."""
+        if self._forwarder is None or self._forwarder.done():
+            self._get_buffer()
+            self._forwarder = asyncio.create_task(self._forward())
+
+    async def _forward(self):
+        """Moves items from the upstream queue into the buffer, pausing when the buffer is full."""
+        while True:
+            try:
+                item = self.upstream.get(block=False)
+            except queue.Empty:
+                await asyncio.sleep(self.interval)
+                continue
+            await self._buffer.put(item)
+
+    # Object Query
+    def qsize(self):
+        buffered = 0 if self._buffer is None else self._buffer.qsize()
+        return buffered + self.upstream.qsize()
+
+    def empty(self):
+        return (self._buffer is None or self._buffer.empty()) and self.upstream.empty()
+
+    def full(self):
+        return self._buffer is not None and self._buffer.full()
+
+    # Transmission
+    def put(self, obj, block=True, timeout=None):
+        self.upstream.put(obj, block=block, timeout=timeout)
+
+    def get(self, block=True, timeout=None):
+        if self._buffer is not None:
+            try:
+                return self._buffer.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self.upstream.get(block=False)  # No loop to forward on, read the upstream through.
+        self._ensure_forwarder()
+        raise queue.Empty
+
+    async def get_async(self, timeout=None, interval=0.0):
+        self._ensure_forwarder()
+        try:
+            if timeout is None:
+                return await self._buffer.get()
+            return await asyncio.wait_for(self._buffer.get(), timeout)
+        except asyncio.TimeoutError:
+            warnings.warn(TimeoutWarning("'get_async'"), stacklevel=2)
+            return None
+
+    def close(self):
+        """Stops the forwarder task, leaving unconsumed items in the upstream queue."""
+        if self._forwarder is not None:
+            self._forwarder.cancel()
+            self._forwarder = None
+
+
 class IOServer(BaseObject):
     def __init__(self):
         self.server = None
@@ -302,7 +613,7 @@ class BroadcastPipe(BaseObject):
         while not connection.poll():
             time.sleep(interval)
             if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                warnings.warn()
+                warnings.warn(TimeoutWarning("'recv_wait'"), stacklevel=2)
                 return None
         return connection.recv()
 
@@ -312,7 +623,7 @@ class BroadcastPipe(BaseObject):
         while not connection.poll():
             await asyncio.sleep(interval)
             if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                warnings.warn()
+                warnings.warn(TimeoutWarning("'recv_wait_async'"), stacklevel=2)
                 return None
         return connection.recv()
 
@@ -329,7 +640,7 @@ class BroadcastPipe(BaseObject):
         while not connection.poll():
             time.sleep(interval)
             if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                warnings.warn()
+                warnings.warn(TimeoutWarning("'recv_bytes_wait'"), stacklevel=2)
                 return None
         return connection.recv_bytes(**kwargs)
 
@@ -339,7 +650,7 @@ class BroadcastPipe(BaseObject):
         while not connection.poll():
             await asyncio.sleep(interval)
             if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                warnings.warn()
+                warnings.warn(TimeoutWarning("'recv_bytes_wait_async'"), stacklevel=2)
                 return None
         return connection.recv_bytes(**kwargs)
 
@@ -421,7 +732,7 @@ class BroadcastQueue(BaseObject):
         while connection.empty():
             time.sleep(interval)
             if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                warnings.warn()
+                warnings.warn(TimeoutWarning("'get_wait'"), stacklevel=2)
                 return None
         return connection.get()
 
@@ -431,7 +742,7 @@ class BroadcastQueue(BaseObject):
         while connection.empty():
             await asyncio.sleep(interval)
             if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                warnings.warn()
+                warnings.warn(TimeoutWarning("'get_wait_async'"), stacklevel=2)
                 return None
         return connection.get()
 
@@ -483,7 +794,7 @@ class InputsHandler(object):
                 return True
             else:
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'wait_for_event'"), stacklevel=2)
                     return None
                 time.sleep(interval)
         interrupt.reset()
@@ -500,7 +811,7 @@ class InputsHandler(object):
                 return True
             else:
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'wait_for_event_async'"), stacklevel=2)
                     return None
                 await asyncio.sleep(interval)
         interrupt.reset()
@@ -516,6 +827,12 @@ class InputsHandler(object):
         self.inputs[name] = q
         self.queues[name] = q
 
+    def add_buffered_queue(self, name, q, maxsize=16, interval=0.0):
+        buffer = BufferedQueue(q, maxsize=maxsize, interval=interval)
+        self.inputs[name] = buffer
+        self.queues[name] = buffer
+        return buffer
+
     def clear_queues(self):
         for q in self.queues:
             del self.inputs[q]
@@ -530,7 +847,7 @@ class InputsHandler(object):
                 return q.get(block=False)
             except queue.Empty:
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'wait_for_queue'"), stacklevel=2)
                     return None
                 time.sleep(interval)
         interrupt.reset()
@@ -545,7 +862,7 @@ class InputsHandler(object):
                 return q.get(block=False)
             except queue.Empty:
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'wait_for_queue_async'"), stacklevel=2)
                     return None
                 await asyncio.sleep(interval)
         interrupt.reset()
@@ -575,7 +892,7 @@ class InputsHandler(object):
                 return connection.recv()
             else:
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'wait_for_pipe'"), stacklevel=2)
                     return None
                 time.sleep(interval)
         interrupt.reset()
@@ -590,7 +907,7 @@ class InputsHandler(object):
                 return connection.recv()
             else:
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'wait_for_pipe_async'"), stacklevel=2)
                     return None
                 await asyncio.sleep(interval)
         interrupt.reset()
@@ -626,7 +943,7 @@ class InputsHandler(object):
                 return connection.recv()
             else:
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'wait_for_broadcast'"), stacklevel=2)
                     return None
                 time.sleep(interval)
         interrupt.reset()
@@ -641,7 +958,7 @@ class InputsHandler(object):
                 return connection.recv()
             else:
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'wait_for_broadcast_async'"), stacklevel=2)
                     return None
                 await asyncio.sleep(interval)
         interrupt.reset()
@@ -671,7 +988,7 @@ class InputsHandler(object):
         elif name in self.broadcasters:
             return self.safe_pipe_recv(self.broadcasters[name], **kwargs)
         else:
-            warnings.warn()
+            warnings.warn(f"{name} is not in this handler", stacklevel=2)
 
     def get_item_wait(self, name, timeout=None, interval=0.0, reset=True):
         if name in self.events:
@@ -683,19 +1000,52 @@ class InputsHandler(object):
         elif name in self.broadcasters:
             return self.wait_for_broadcast(name=name, timeout=timeout, interval=interval)
         else:
-            warnings.warn()
+            warnings.warn(f"{name} is not in this handler", stacklevel=2)
 
     async def get_item_wait_async(self, name, timeout=None, interval=0.0, reset=True):
         if name in self.events:
             return await self.wait_for_event_async(name=name, reset=reset, timeout=None, interval=interval)
         if name in self.queues:
+            # Fast path, a ready item skips the scheduler round trip of the coroutine wait entirely.
+            try:
+                return self.queues[name].get(block=False)
+            except queue.Empty:
+                pass
             return await self.wait_for_queue_async(name=name, timeout=timeout, interval=interval)
         elif name in self.pipes:
             return await self.wait_for_pipe_async(name=name, timeout=timeout, interval=interval)
         elif name in self.broadcasters:
             return await self.wait_for_broadcast_async(name=name, timeout=timeout, interval=interval)
         else:
-            warnings.warn()
+            warnings.warn(f"{name} is not in this handler", stacklevel=2)
+
+    async def get_batch_wait_async(self, name, max_n=64, max_wait=None, interval=0.0, reset=True):
+        """Asynchronously waits for an item then drains the input, amortizing awaits over a whole batch.
+
+        Args:
+            name (str): The name of the input to get items from.
+            max_n (int, optional): The most items to return in one batch.
+            max_wait (float, optional): The time in seconds to wait for the first item.
+            interval (float, optional): The time in seconds between item checks.
+            reset (bool, optional): Determines if an event input will be reset after reading.
+
+        Returns:
+            list: The items gotten, empty when the wait timed out.
+        """
+        items = []
+        first = await self.get_item_wait_async(name, timeout=max_wait, interval=interval, reset=reset)
+        if first is None:
+            return items
+        items.append(first)
+        # Only queue inputs hold more than one item; draining an event would pad the batch with False.
+        if name not in self.queues:
+            return items
+        while len(items) < max_n:
+            item = self.get_item(name, reset=reset)
+            if item is None:
+                break
+            items.append(item)
+        return items
 
     def stop_all(self):
         self.interrupts.interrupt_all_processes()
@@ -767,7 +1117,7 @@ class OutputsHandler(object):
                 return True
             else:
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'wait_for_event_clear'"), stacklevel=2)
                     return None
                 time.sleep(interval)
         interrupt.reset()
@@ -782,7 +1132,7 @@ class OutputsHandler(object):
                 return True
             else:
                 if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn()
+                    warnings.warn(TimeoutWarning("'wait_for_event_clear_async'"), stacklevel=2)
                     return None
                 await asyncio.sleep(interval)
         interrupt.reset()
@@ -853,7 +1203,31 @@ class OutputsHandler(object):
         elif name in self.broadcasters:
             return self.broadcasters[name].send(item, **kwargs)
         else:
-            warnings.warn()
+            warnings.warn(f"{name} is not in this handler", stacklevel=2)
+
+    def send_items(self, name, items, **kwargs):
+        """Sends several items through an output with a single call.
+
+        Args:
+            name (str): The name of the output to send the items through.
+            items: The iterable of items to send.
+        """
+        if name in self.events:
+            self.events[name].set()
+        elif name in self.queues:
+            q = self.queues[name]
+            for item in items:
+                q.put(item, **kwargs)
+        elif name in self.pipes:
+            connection = self.pipes[name]
+            for item in items:
+                connection.send(item, **kwargs)
+        elif name in self.broadcasters:
+            broadcaster = self.broadcasters[name]
+            for item in items:
+                broadcaster.send(item, **kwargs)
+        else:
+            warnings.warn(f"{name} is not in this handler", stacklevel=2)
 
     def stop_all(self):
         self.interrupts.interrupt_all_processes()
@@ -14,36 +14,316 @@ __status__ = "Prototype"
 
 # Default Libraries #
 import asyncio
-import copy
+import collections
+import functools
+import mmap
 import multiprocessing
 import multiprocessing.connection
 from multiprocessing import Process, Pool, Lock, Event, Queue, Pipe
+from multiprocessing import shared_memory
+import os
+import random
+import sys
+import threading
 import warnings
+import weakref
 import time
 import typing
 
 # Downloaded Libraries #
 import advancedlogging
 from advancedlogging import AdvancedLogger, ObjectWithLogging
-from baseobjects import StaticWrapper, TimeoutWarning
+from baseobjects import TimeoutWarning
 
 # Local Libraries #
 
 
 # Definitions #
+SHARED_MEMORY_THRESHOLD = 64 * 1024  # Payloads at least this many bytes are moved out of the process pipe.
+CTRL_SIZE = 4096  # The size of the control channel buffer in bytes.
+
+
+# Classes #
+class _SharedMemoryReference:
+    """A small picklable stand-in for a large bytes-like payload placed in shared memory.
+
+    The payload is copied into a SharedMemory block when this reference is created and only the block's
+    name and size travel through the process pipe, avoiding a pickle and pipe copy of the payload itself.
+    The child reconstitutes the payload with resolve, which also unlinks the block.
+
+    Attributes:
+        name (str): The name of the SharedMemory block holding the payload.
+        size (int): The size of the payload in bytes.
+        payload_type: The type to rebuild the payload as.
+
+    Args:
+        payload: The bytes-like object to move into shared memory.
+    """
+    # Construction/Destruction
+    def __init__(self, payload):
+        self.payload_type = type(payload)
+        self.size = len(payload)
+        shm = shared_memory.SharedMemory(create=True, size=self.size)
+        shm.buf[:self.size] = payload
+        self.name = shm.name
+        shm.close()  # The block persists by name until unlinked, the local mapping is not needed.
+
+    # Methods
+    def resolve(self):
+        """Reconstitutes the payload from shared memory and releases the block.
+
+        Returns:
+            The original payload.
+        """
+        shm = shared_memory.SharedMemory(name=self.name)
+        try:
+            payload = self.payload_type(shm.buf[:self.size])
+        finally:
+            shm.close()
+            shm.unlink()
+        return payload
+
+    def release(self):
+        """Unlinks the shared memory block without reading it, for cleanup when the child never consumed it."""
+        try:
+            shm = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return
+        shm.close()
+        shm.unlink()
+
+
+class _LoggerRef:
+    """A lightweight picklable stand-in for an AdvancedLogger passed as a process argument.
+
+    Loggers drag their whole handler graph through the pickle, which dominates the cost of serializing
+    a process's arguments. This reference carries only the logger's name and level and resolves back to
+    the named logger on the other side, where the logging registry returns the existing configured
+    instance or builds a fresh one at the recorded level.
+
+    Attributes:
+        name (str): The name of the referenced logger.
+        level (int): The level of the referenced logger.
+
+    Args:
+        logger (:obj:`AdvancedLogger`): The logger to reference.
+    """
+    # Construction/Destruction
+    def __init__(self, logger):
+        self.name = logger.name
+        self.level = logger.level
+
+    # Methods
+    def resolve(self):
+        """Returns the named AdvancedLogger, setting it to the recorded level.
+
+        Returns:
+            :obj:`AdvancedLogger`: The referenced logger.
+        """
+        logger = AdvancedLogger(self.name)
+        logger.setLevel(self.level)
+        return logger
+
+
 # Functions #
+def _share_payload(value):
+    """Moves a large bytes-like value into shared memory, returning small values unchanged.
+
+    Args:
+        value: The value to possibly move into shared memory.
+
+    Returns:
+        Either the original value or a _SharedMemoryReference standing in for it.
+    """
+    if isinstance(value, (bytes, bytearray)) and len(value) >= SHARED_MEMORY_THRESHOLD:
+        return _SharedMemoryReference(value)
+    return value
+
+
+def _resolve_payload(value):
+    """Reconstitutes a value that was moved into shared memory, returning other values unchanged.
+
+    Args:
+        value: The value to possibly reconstitute.
+
+    Returns:
+        The original payload.
+    """
+    if isinstance(value, _SharedMemoryReference):
+        return value.resolve()
+    return value
+
+
 def run_method(obj, method, **kwargs):
+    kwargs = {key: _resolve_payload(value) for key, value in kwargs.items()}
     return getattr(obj, method)(**kwargs)
 
 
+def _run_then_set(done_event, target, *args, **kwargs):
+    """Runs a process target then sets the completion event, so waiters block on a signal not a sleep.
+
+    Args:
+        done_event (:obj:`Event`): The event to set when the target finishes.
+        target: The function to run in the process.
+        *args: The arguments for the target.
+        **kwargs: The keyword arguments for the target.
+    """
+    try:
+        return target(*args, **kwargs)
+    finally:
+        done_event.set()
+
+
+def _close_process(process, timeout=5.0):
+    """Terminates, reaps, and closes a process so its fds and semaphores are released.
+
+    The child is sent SIGTERM and joined for the grace period, killed if it does not exit, joined again,
+    then closed. Joining before closing is what lets the reaper reclaim the resources instead of leaking
+    them to the resource tracker.
+
+    Args:
+        process (:obj:`Process`): The process to close.
+        timeout (float, optional): The time in seconds to wait for the child to exit after terminate.
+    """
+    try:
+        if process.is_alive():
+            process.terminate()
+            process.join(timeout)
+        if process.is_alive():
+            process.kill()
+            process.join(1.0)
+        process.close()
+    except ValueError:  # The process was already closed.
+        pass
+
+
 # Classes #
+# Scheduling #
+class WorkStealingScheduler:
+    """Distributes work items across per-worker deques with stealing from busy workers.
+
+    Each worker owns a deque. The owner pops its newest item first which keeps recently pushed work local,
+    while an idle worker steals the oldest item from a randomly chosen victim that still has work. This
+    balances uneven workloads without funneling every item through one shared queue.
+
+    Attributes:
+        deques (:obj:`list` of :obj:`deque`): The work item deque for each worker.
+        locks (:obj:`list` of :obj:`Lock`): The lock guarding each worker's deque.
+        work_available (:obj:`list` of :obj:`bool`): Flags for skipping empty victims when stealing.
+
+    Args:
+        workers (int, optional): The number of workers to create deques for. Defaults to the CPU count.
+    """
+    # Construction/Destruction
+    def __init__(self, workers=None):
+        if workers is None:
+            workers = SeparateProcess.cpu_count()
+        self.deques = [collections.deque() for _ in range(workers)]
+        self.locks = [threading.Lock() for _ in range(workers)]
+        self.work_available = [False] * workers
+
+    def __len__(self):
+        """The total number of work items across all workers."""
+        return sum(len(d) for d in self.deques)
+
+    # Methods
+    def seed(self, items):
+        """Distributes work items round-robin across the worker deques.
+
+        Args:
+            items: The iterable of work items to distribute.
+        """
+        workers = len(self.deques)
+        for index, item in enumerate(items):
+            self.push(index % workers, item)
+
+    def push(self, worker, item):
+        """Adds a work item to a worker's own deque.
+
+        Args:
+            worker (int): The index of the worker to give the item to.
+            item: The work item to add.
+        """
+        with self.locks[worker]:
+            self.deques[worker].append(item)
+            self.work_available[worker] = True
+
+    def pop(self, worker):
+        """Takes the newest item from a worker's own deque.
+
+        Args:
+            worker (int): The index of the worker taking the item.
+
+        Returns:
+            The work item or None if the worker's deque is empty.
+        """
+        with self.locks[worker]:
+            try:
+                return self.deques[worker].pop()
+            except IndexError:
+                self.work_available[worker] = False
+                return None
+
+    def steal(self, worker):
+        """Takes the oldest item from a random other worker that still has work.
+
+        Args:
+            worker (int): The index of the stealing worker.
+
+        Returns:
+            The stolen work item or None if no victim had work.
+        """
+        victims = [index for index, available in enumerate(self.work_available)
+                   if available and index != worker]
+        random.shuffle(victims)
+        for victim in victims:
+            with self.locks[victim]:
+                try:
+                    return self.deques[victim].popleft()
+                except IndexError:
+                    self.work_available[victim] = False
+        return None
+
+    def get(self, worker):
+        """Takes the next work item for a worker, stealing when its own deque is empty.
+
+        Args:
+            worker (int): The index of the worker requesting work.
+
+        Returns:
+            The work item or None if no work remains anywhere.
+        """
+        item = self.pop(worker)
+        if item is None:
+            item = self.steal(worker)
+        return item
+
+    def worker_loop(self, worker, execute):
+        """Continuously takes and executes work items until none remain.
+
+        Args:
+            worker (int): The index of the worker running this loop.
+            execute: The function to call with each work item.
+        """
+        while True:
+            item = self.get(worker)
+            if item is None:
+                return
+            execute(item)
+
+
 # Processing #
 # Todo: Add automatic closing to release resources automatically
-class SeparateProcess(ObjectWithLogging, StaticWrapper):
+class SeparateProcess(ObjectWithLogging):
     """A wrapper for Process which adds restarting and passing a method to be run in a separate process.
 
+    Attribute access forwards to the wrapped Process through plain properties rather than a reflection
+    layer, so hot reads like is_alive and exitcode are direct descriptor lookups.
+
     Class Attributes:
-        CPU_COUNT (int): The number of CPUs this computer has.
+        CTX: The multiprocessing context used to create processes. The fork start method lets children
+            inherit loggers, handlers, and closures by reference instead of serializing them through a
+            pickle roundtrip, so it is the default where available and spawn is used otherwise.
         class_loggers (:obj:`dict` of :obj:`AdvancedLogger`): The loggers for this class.
 
     Attributes:
@@ -53,7 +333,9 @@ class SeparateProcess(ObjectWithLogging, StaticWrapper):
         args: The arguments for the function to be run in the separate process.
         kwargs: The keyword arguments for the function to be run the in the separate process.
         method_wrapper: A wrapper function which executes a method of an object.
+        done_event (:obj:`Event`): The event the child sets when its target finishes running.
         _process (:obj:`Process`): The Process object that this object is wrapping.
+        _process_dirty (bool): Determines if the process settings changed since the process was created.
 
     Args:
         target: The function that will be executed by the separate process.
@@ -64,47 +346,114 @@ class SeparateProcess(ObjectWithLogging, StaticWrapper):
         delay (bool): Determines if the Process will be constructed now or later.
         init (bool): Determines if this object will construct.
     """
-    _wrapped_types = [Process(daemon=True)]
-    _wrap_attributes = ["_process"]
-    CPU_COUNT = multiprocessing.cpu_count()
+    CTX = multiprocessing.get_context("fork" if sys.platform != "win32" else "spawn")
     class_loggers = {"separate_process": AdvancedLogger("separate_process")}
+    _name = ""  # Class level default so the name property works before __init__ finishes.
+    _process = None
+    # Class level defaults so unpickled objects, which restore from a targeted state snapshot, have a
+    # control channel slate to lazily rebuild from.
+    _ctrl = None
+    _ctrl_len = None
+    _ctrl_event = None
+
+    # Class Methods
+    @classmethod
+    def cpu_count(cls):
+        """Counts the CPUs available to this process, evaluated lazily instead of at import.
+
+        Returns:
+            int: The number of CPUs this process may run on, respecting affinity restrictions where the
+                platform reports them.
+        """
+        try:
+            return len(os.sched_getaffinity(0))
+        except AttributeError:
+            return os.cpu_count() or 1
 
     # Construction/Destruction
     def __init__(self, target=None, name="", args=(), kwargs={}, daemon=None, delay=False, init=True):
         super().__init__()
         self.method_wrapper = run_method
 
+        self._name = ""
+        self._daemon = None
+        self._target = None
+        self._args = ()
+        self._kwargs = {}
+
         self._process = None
+        self._process_dirty = True
+        self._shared_payloads = []
+        self.done_event = self.CTX.Event()
+
+        self._ctrl = None
+        self._ctrl_len = None
+        self._ctrl_event = None
 
         if init:
             self.construct(target, name, args, kwargs, daemon, delay)
 
+    @property
+    def name(self):
+        """str: The name of this object and its process."""
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        if self._process is not None:
+            self._process.name = value
+
+    @property
+    def daemon(self):
+        """bool: Determines if the separate process will continue after the main process exits."""
+        return self._daemon
+
+    @daemon.setter
+    def daemon(self, value):
+        self._daemon = value
+        if self._process is not None:
+            self._process.daemon = value
+
     @property
     def target(self):
-        """The function that will be executed by the separate process, gets from _process."""
+        """The function that will be executed by the separate process."""
         return self._target
 
     @target.setter
     def target(self, value):
         self._target = value
+        self._process_dirty = True
 
     @property
     def args(self):
-        """The arguments for the function to be run in the separate process, gets from _process."""
+        """The arguments for the function to be run in the separate process."""
         return self._args
 
     @args.setter
     def args(self, value):
         self._args = tuple(value)
+        self._process_dirty = True
 
     @property
     def kwargs(self):
-        """The keyword arguments for the function to be run the in the separate process, get from _process."""
+        """The keyword arguments for the function to be run the in the separate process."""
         return self._kwargs
 
     @kwargs.setter
     def kwargs(self, value):
         self._kwargs = dict(value)
+        self._process_dirty = True
+
+    @property
+    def exitcode(self):
+        """The exit code of the process, None if it has not exited."""
+        return self._process.exitcode
+
+    @property
+    def sentinel(self):
+        """The file descriptor which becomes ready when the process exits."""
+        return self._process.sentinel
 
     # Pickling
     def __getstate__(self):
@@ -113,24 +462,19 @@ class SeparateProcess(ObjectWithLogging, StaticWrapper):
         Returns:
             dict: A dictionary of this object's attributes.
         """
-        out_dict = self.__dict__.copy()
-        process = out_dict["__process"]
-        if process:
-            kwargs = {"target": process._target,
-                      "name": process._name,
-                      "args": process._args,
-                      "kwargs": process._kwargs}
-            try:
-                kwargs["daemon"] = process.daemon
-            except AttributeError:
-                pass
-        else:
-            kwargs = None
-
-        out_dict["new_process_kwargs"] = kwargs
-        out_dict["__process"] = None
-
-        return out_dict
+        # A live Process cannot be pickled, so only the stashed attributes needed to rebuild one travel
+        # rather than a full __dict__ copy.
+        return {"loggers": self.loggers,
+                "method_wrapper": self.method_wrapper,
+                "_name": self._name,
+                "_daemon": self._daemon,
+                "_target": self._target,
+                "_args": tuple(_LoggerRef(a) if isinstance(a, AdvancedLogger) else a for a in self._args),
+                "_kwargs": {key: _LoggerRef(value) if isinstance(value, AdvancedLogger) else value
+                            for key, value in self._kwargs.items()},
+                "_shared_payloads": self._shared_payloads,
+                "_process_dirty": self._process_dirty,
+                "new_process": self._process is not None}
 
     def __setstate__(self, in_dict):
         """Builds this object based on a dictionary of corresponding attributes.
@@ -138,10 +482,15 @@ class SeparateProcess(ObjectWithLogging, StaticWrapper):
         Args:
             in_dict (dict): The attributes to build this object from.
         """
-        process_kwargs = in_dict.pop("new_process_kwargs")
+        new_process = in_dict.pop("new_process")
+        in_dict["_process"] = None
+        in_dict["done_event"] = self.CTX.Event()  # Process events only cross by inheritance, not pickle.
+        in_dict["_args"] = tuple(a.resolve() if isinstance(a, _LoggerRef) else a for a in in_dict["_args"])
+        in_dict["_kwargs"] = {key: value.resolve() if isinstance(value, _LoggerRef) else value
+                              for key, value in in_dict["_kwargs"].items()}
         self.__dict__ = in_dict
-        if process_kwargs:
-            self.create_process(**process_kwargs)
+        if new_process:
+            self.create_process()
 
     # Constructors
     def construct(self, target=None, name=None, args=(), kwargs={}, daemon=None, delay=False):
@@ -197,34 +546,35 @@ class SeparateProcess(ObjectWithLogging, StaticWrapper):
             kwargs: The keyword arguments for the function to be run the in the separate process.
             daemon (bool): Determines if the separate process will continue after the main process exits.
         """
-        # Get previous attributes
-        if self._process is not None:
-            if target is None:
-                try:
-                    target = self._target
-                except AttributeError:
-                    pass
-            if daemon is None:
-                daemon = self.daemon
-            if not args:
-                args = self._args
-            if not kwargs:
-                kwargs = self._kwargs
-
-        # Create new Process
-        self._process = Process()
-
-        # Set attributes after stashed attributes are set.
-        if name is not None:
-            self._process.name = name
+        # Update the stashed attributes with any given ones
         if target is not None:
-            self._process._target = target
+            self._target = target
+        if name is not None:
+            self._name = name
         if daemon is not None:
-            self._process.daemon = daemon
+            self._daemon = daemon
         if args:
-            self._process._args = args
+            self._args = tuple(args)
         if kwargs:
-            self._process._kwargs = kwargs
+            self._kwargs = dict(kwargs)
+
+        # Create the new Process through its constructor so the attributes are set in one step. The
+        # target is wrapped so the child signals done_event on completion, letting waiters use an event
+        # wait instead of a padded sleep.
+        self.done_event.clear()
+        self._process = self.CTX.Process(target=functools.partial(_run_then_set, self.done_event, self._target),
+                                         name=self._name or None, args=self._args,
+                                         kwargs=self._kwargs, daemon=self._daemon)
+        if not self._name:
+            self._name = self._process.name
+        self._process_dirty = False
+
+        # Create the control channel once, it is reused across process recreations.
+        if self._ctrl is None:
+            self.create_ctrl()
+
+        # Close the process when this object is collected so its fds are reliably reclaimed.
+        weakref.finalize(self, _close_process, self._process)
 
     def set_process(self, process):
         """Set this object's process to a new one.
@@ -238,25 +588,100 @@ class SeparateProcess(ObjectWithLogging, StaticWrapper):
     def target_object_method(self, obj, method, args=(), kwargs={}):
         """Set the target to be a method of an object.
 
+        Large bytes-like keyword arguments are moved into shared memory so only a small reference is
+        pickled through the process pipe; the child reconstitutes them before calling the method.
+
         Args:
             obj: The object the method will be executed from.
             method (str): The name of the method in the object.
             args: Arguments to be used by the method.
             kwargs: The keywords arguments to be used by the method.
         """
-        kwargs["obj"] = obj
-        kwargs["method"] = method
-        self.create_process(target=self.method_wrapper, args=args, kwargs=kwargs)
+        kwargs = {key: _share_payload(value) for key, value in kwargs.items()}
+        shared = [value for value in kwargs.values() if isinstance(value, _SharedMemoryReference)]
+        self._shared_payloads.extend(shared)
+        if shared:
+            # The wrapper must run in the child to reconstitute the shared payloads before the call.
+            target = functools.partial(self.method_wrapper, obj, method)
+        else:
+            # Bound methods pickle by reference, so the child calls the method with no getattr dispatch.
+            target = getattr(obj, method)
+        self.create_process(target=target, args=args, kwargs=kwargs)
+
+    def specialize(self):
+        """Folds the stashed arguments into the target through partial evaluation.
+
+        Binding the arguments once at specialization time makes the child's entry call a plain
+        zero-argument invocation, with no per-call argument unpacking or keyword re-parse, which pays
+        off for targets the child invokes repeatedly. Skipped when there is nothing to bind. The next
+        start recreates the process since the target changed.
+        """
+        if self._target is None or not (self._args or self._kwargs):
+            return
+        self._target = functools.partial(self._target, *self._args, **self._kwargs)
+        self._args = ()
+        self._kwargs = {}
+        self._process_dirty = True
+
+    # Control Channel
+    def create_ctrl(self):
+        """Creates the control channel for passing small messages between this object and the child.
+
+        The channel only exists under the fork start method: the child inherits the anonymous shared
+        mmap at fork, so a control message is a memory write plus an event set with no pipe syscall on
+        the hot path. Other start methods get no channel, since nothing would carry an end of it to
+        the child, and send_ctrl and recv_ctrl raise there instead of silently going nowhere.
+        """
+        if self.CTX.get_start_method() == "fork":
+            self._ctrl = mmap.mmap(-1, CTRL_SIZE)
+            self._ctrl_len = self.CTX.Value("i", 0)
+            self._ctrl_event = self.CTX.Event()
+
+    def send_ctrl(self, payload):
+        """Sends a small control message, such as a stop or reset signal, to the child.
+
+        Args:
+            payload (bytes): The message to send, at most CTRL_SIZE bytes.
+
+        Raises:
+            RuntimeError: When there is no control channel, which only the fork start method has.
+        """
+        if self._ctrl is None:
+            raise RuntimeError("the control channel requires the fork start method")
+        with self._ctrl_len.get_lock():
+            self._ctrl[:len(payload)] = payload
+            self._ctrl_len.value = len(payload)
+        self._ctrl_event.set()
+
+    def recv_ctrl(self, timeout=None):
+        """Receives a control message, meant to be called from the child.
+
+        Args:
+            timeout (float, optional): The time in seconds to wait for a message.
+
+        Returns:
+            bytes: The message, or None if the wait timed out.
+
+        Raises:
+            RuntimeError: When there is no control channel, which only the fork start method has.
+        """
+        if self._ctrl is None:
+            raise RuntimeError("the control channel requires the fork start method")
+        if not self._ctrl_event.wait(timeout):
+            warnings.warn(TimeoutWarning("'recv_ctrl'"), stacklevel=2)
+            return None
+        self._ctrl_event.clear()
+        with self._ctrl_len.get_lock():
+            return bytes(self._ctrl[:self._ctrl_len.value])
 
     # Execution
     def start(self):
-        """Starts running the process."""
+        """Starts running the process, recreating it when its settings changed or it already ran."""
         self.trace_log("separate_process", "start", "spawning new process...", name=self.name, level="DEBUG")
-        try:
-            self._process.start()
-        except:
+        # A process object can only be started once, so a previous run also means a new one is needed.
+        if self._process is None or self._process_dirty or self._process.ident is not None:
             self.create_process()
-            self._process.start()
+        self._process.start()
 
     def join(self, timeout=None):
         """Wait fpr the process to return/exit.
@@ -271,16 +696,49 @@ class SeparateProcess(ObjectWithLogging, StaticWrapper):
     async def join_async(self, timeout=None, interval=0.0):
         """Asynchronously, wait for the process to return/exit.
 
+        The process' sentinel is registered with the event loop so the wait is kernel signaled rather than a
+        polling loop, which means no CPU is spent while waiting.
+
         Args:
             timeout (float, optional): The time in seconds to wait for the process to exit.
-            interval (float, optional): The time in seconds between each queue query.
+            interval (float, optional): Kept for API compatibility, the sentinel wait does not poll.
         """
-        start_time = time.perf_counter()
-        while self._process.exitcode is None:
-            await asyncio.sleep(interval)
-            if timeout is not None and (time.perf_counter() - start_time) >= timeout:
+        if self._process.exitcode is not None:
+            return
+
+        loop = asyncio.get_event_loop()
+        sentinel = self._process.sentinel
+        try:
+            exit_future = loop.create_future()
+            loop.add_reader(sentinel, self._sentinel_callback, loop, sentinel, exit_future)
+        except (NotImplementedError, PermissionError):
+            # Some event loops cannot watch process sentinels, wait for the sentinel in a thread instead.
+            await loop.run_in_executor(None, multiprocessing.connection.wait, [sentinel], timeout)
+            if self._process.exitcode is None:
                 warnings.warn(TimeoutWarning("'join_async'"), stacklevel=2)
-                return
+            return
+
+        try:
+            await asyncio.wait_for(exit_future, timeout)
+            # The process has exited, reap it in a thread so exitcode is set without blocking the loop.
+            await loop.run_in_executor(None, self._process.join)
+        except asyncio.TimeoutError:
+            warnings.warn(TimeoutWarning("'join_async'"), stacklevel=2)
+        finally:
+            loop.remove_reader(sentinel)
+
+    @staticmethod
+    def _sentinel_callback(loop, sentinel, exit_future):
+        """Resolves the waiting future when the process' sentinel becomes ready.
+
+        Args:
+            loop: The event loop the sentinel is registered with.
+            sentinel: The process' sentinel file descriptor.
+            exit_future (:obj:`Future`): The future to resolve.
+        """
+        loop.remove_reader(sentinel)
+        if not exit_future.done():
+            exit_future.set_result(None)
 
     def join_async_task(self, timeout=None, interval=0.0):
         """Creates an asyncio task which waits for the process to return/exit.
@@ -293,15 +751,37 @@ class SeparateProcess(ObjectWithLogging, StaticWrapper):
 
     def restart(self):
         """Restarts the process."""
-        if isinstance(self._process, Process):
+        if self._process is not None:
             if self._process.is_alive():
                 self._process.terminate()
         self.create_process()
         self._process.start()
 
-    def close(self):
-        """Closes the process and frees the resources."""
-        if isinstance(self._process, Process):
-            if self._process.is_alive():
-                self._process.terminate()
-            self._process.close()
+    def close(self, timeout=5.0):
+        """Closes the process and frees the resources.
+
+        The child is asked to terminate and given a grace period to exit before being killed, then the
+        process is joined so its file descriptors and semaphores are reclaimed rather than leaked to the
+        resource tracker.
+
+        Args:
+            timeout (float, optional): The time in seconds to wait for the child to exit after terminate.
+        """
+        if self._process is not None:
+            _close_process(self._process, timeout)
+        for reference in self._shared_payloads:
+            reference.release()
+        self._shared_payloads.clear()
+
+    # Context Managers
+    def __enter__(self):
+        """Enters a context block, returning this object."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exits a context block, closing the process."""
+        self.close()
+
+    def __del__(self):
+        """Closes the process when this object is deleted."""
+        self.close()
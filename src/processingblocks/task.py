@@ -15,9 +15,12 @@ __status__ = "Prototype"
 # Default Libraries #
 import asyncio
 import dataclasses
+import functools
+import logging
 from multiprocessing import Process, Pool, Lock, Event, Queue, Pipe
 import warnings
 import time
+import types
 import typing
 
 # Downloaded Libraries #
@@ -30,6 +33,21 @@ from .processors import SeparateProcess
 
 
 # Definitions #
+# Functions #
+def run_pool_unit(cls, state, method, **kwargs):
+    """Rebuilds a task from its pool-transport state in a pool worker and runs the requested method.
+
+    Args:
+        cls: The task class to rebuild.
+        state (dict): The pool-transport snapshot from pool_state.
+        method (str): The name of the method to run.
+        **kwargs: The keyword arguments for the method.
+    """
+    obj = cls.__new__(cls)
+    obj.__setstate__(state)
+    return getattr(obj, method)(**kwargs)
+
+
 # Classes #
 # Tasks #
 # Todo: Maybe add some warning when editing a Task while it is running.
@@ -51,6 +69,7 @@ class Task(ObjectWithLogging):
         allow_closure (bool): Determines if closure will be run.
         use_async (bool): Determines if async methods will be used by default.
         alive_event (:obj:``Event): The Event that determines if alive.
+        done_event (:obj:`Event`): The Event that is set when a run finishes, allowing joins to block on it.
         terminate_event (:obj:`Event`): The Event used to stop the task loop.
         events (dict): Holds the Events for this object.
         locks (dict): Holds the Locks for this object.
@@ -77,10 +96,11 @@ class Task(ObjectWithLogging):
         init (bool, optional): Determines if this object should be initialized.
     """
     class_loggers = {"task_root": AdvancedLogger("task_root")}
+    _EMPTY = types.MappingProxyType({})  # Shared empty kwargs so omitted arguments cost no allocation.
 
     # Construction/Destruction
     def __init__(self, name=None, allow_setup=True, allow_closure=True,
-                 s_kwargs={}, t_kwargs={}, c_kwargs={}, init=True):
+                 s_kwargs=None, t_kwargs=None, c_kwargs=None, init=True):
         super().__init__()
         self.name = ""
         self.async_loop = asyncio.get_event_loop()
@@ -90,6 +110,8 @@ class Task(ObjectWithLogging):
         self.allow_closure = True
         self.use_async = True
         self.alive_event = Event()
+        self.done_event = Event()
+        self.done_event.set()
         self.terminate_event = Event()
         self.events = {}
         self.locks = {}
@@ -102,12 +124,27 @@ class Task(ObjectWithLogging):
         self.outputs = None
 
         self.process = None
+        self._process_setup_cache = None
 
         self._execute_setup = None
         self._execute_task = None
         self._execute_task_loop = None
         self._execute_closure = None
 
+        self._setup_is_async = False
+        self._task_is_async = False
+        self._closure_is_async = False
+        self._trace_enabled = False
+        self._task_root_logger = None
+
+        self.max_inflight = 8
+        self._inflight = None
+        self._inflight_count = 0
+        self._drained = None
+
+        self._stop_event = None
+        self._stop_loop = None
+
         if init:
             self.construct(name, allow_setup, allow_closure, s_kwargs, t_kwargs, c_kwargs)
 
@@ -118,11 +155,7 @@ class Task(ObjectWithLogging):
         When set it will raise an error if the Task is running.
         """
         if self.is_alive():
-            if asyncio.iscoroutinefunction(self._execute_task) or asyncio.iscoroutinefunction(self._execute_setup) or \
-               asyncio.iscoroutinefunction(self._execute_closure):
-                return True
-            else:
-                return False
+            return self._task_is_async or self._setup_is_async or self._closure_is_async
         else:
             return self._is_async
 
@@ -161,6 +194,30 @@ class Task(ObjectWithLogging):
         """
         out_dict = self.__dict__.copy()
         del out_dict["async_loop"]
+        # The in-flight primitives are bound to this process' event loop, the other side rebuilds its own.
+        out_dict["_inflight"] = None
+        out_dict["_drained"] = None
+        out_dict["_stop_event"] = None
+        out_dict["_stop_loop"] = None
+        return out_dict
+
+    def pool_state(self):
+        """Creates a picklable snapshot of this task for transport through a pool's job queue.
+
+        Process shared primitives only cross by inheritance, which a pool's job queue does not
+        provide, so the events and the IO handlers are dropped here and the worker rebuilds fresh
+        local ones on unpickle. Pooled units are therefore self contained; IO wired to other
+        processes does not follow them into the pool.
+
+        Returns:
+            dict: The attributes to rebuild this object from in a pool worker.
+        """
+        out_dict = self.__getstate__()
+        out_dict["alive_event"] = None
+        out_dict["done_event"] = None
+        out_dict["terminate_event"] = None
+        out_dict["inputs"] = None
+        out_dict["outputs"] = None
         return out_dict
 
     def __setstate__(self, in_dict):
@@ -169,11 +226,23 @@ class Task(ObjectWithLogging):
         Args:
             in_dict (dict): The attributes to build this object from.
         """
-        in_dict["async_loop"] = asyncio.get_event_loop()
+        try:
+            in_dict["async_loop"] = asyncio.get_event_loop()
+        except RuntimeError:  # A pool worker has no loop yet, make one and keep it for later units.
+            in_dict["async_loop"] = asyncio.new_event_loop()
+            asyncio.set_event_loop(in_dict["async_loop"])
+        if in_dict.get("alive_event") is None:
+            # Rebuilt from a pool-transport snapshot, recreate the stripped primitives locally.
+            in_dict["alive_event"] = Event()
+            in_dict["done_event"] = Event()
+            in_dict["done_event"].set()
+            in_dict["terminate_event"] = Event()
         self.__dict__ = in_dict
+        if self.inputs is None:
+            self.construct_io()
 
     # Constructors/Destructors
-    def construct(self, name=None, allow_setup=True, allow_closure=True, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    def construct(self, name=None, allow_setup=True, allow_closure=True, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Constructs this object.
 
         Args:
@@ -185,9 +254,9 @@ class Task(ObjectWithLogging):
             c_kwargs (dict, optional): Contains the keyword arguments to be used in the closure method.
         """
         self.name = name
-        self.setup_kwargs = s_kwargs
-        self.task_kwargs = t_kwargs
-        self.closure_kwargs = c_kwargs
+        self.setup_kwargs = {} if s_kwargs is None else s_kwargs
+        self.task_kwargs = {} if t_kwargs is None else t_kwargs
+        self.closure_kwargs = {} if c_kwargs is None else c_kwargs
         self.allow_setup = allow_setup
         self.allow_closure = allow_closure
 
@@ -335,12 +404,33 @@ class Task(ObjectWithLogging):
                 self.terminate_event.set()
 
     async def task_loop_async(self, **kwargs):
-        """An async loop that executes the _execute_task consecutively until an event stops it."""
-        while not self.terminate_event.is_set():
-            if not self.inputs.get_item("SelfStop"):
-                await asyncio.create_task(self._execute_task(**kwargs))
-            else:
-                self.terminate_event.set()
+        """An async loop that executes the _execute_task consecutively until an event stops it.
+
+        Termination is edge triggered: terminate() sets an asyncio.Event through the loop, which wins
+        the race against the in-flight task and ends the loop immediately instead of waiting for the
+        next flag poll.
+        """
+        self._stop_event = asyncio.Event()
+        self._stop_loop = asyncio.get_running_loop()
+        stop_wait = asyncio.create_task(self._stop_event.wait())
+        try:
+            while not self.terminate_event.is_set():
+                if self.inputs.get_item("SelfStop"):
+                    self.terminate_event.set()
+                    break
+                work = asyncio.create_task(self._execute_task(**kwargs))
+                done, _ = await asyncio.wait({work, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+                if work in done:
+                    work.result()  # Re-raise a task failure instead of leaving it unretrieved.
+                if stop_wait in done:
+                    work.cancel()
+                    try:
+                        await work
+                    except asyncio.CancelledError:
+                        pass
+                    break
+        finally:
+            stop_wait.cancel()
 
     # Closure
     def closure(self, **kwargs):
@@ -366,6 +456,7 @@ class Task(ObjectWithLogging):
         if kwargs:
             self.setup_kwargs = kwargs
         self._execute_setup = func
+        self._setup_is_async = asyncio.iscoroutinefunction(func)
 
     def get_task(self):
         """Gets the task function to run.
@@ -385,6 +476,7 @@ class Task(ObjectWithLogging):
         if kwargs:
             self.task_kwargs = kwargs
         self._execute_task = func
+        self._task_is_async = asyncio.iscoroutinefunction(func)
 
     def get_task_loop(self):
         """Gets the task loop function to run.
@@ -420,29 +512,87 @@ class Task(ObjectWithLogging):
         if kwargs:
             self.closure_kwargs = kwargs
         self._execute_closure = func
+        self._closure_is_async = asyncio.iscoroutinefunction(func)
 
     # Preparation
     def prepare(self):
-        """Sets the execute methods."""
+        """Sets the execute methods and resolves how each section executes.
+
+        The coroutine checks are done when an execute method is assigned so the hot execution paths read
+        cached booleans instead of re-introspecting the execute methods on every call.
+        """
         if self._execute_setup is None:
             self._execute_setup = self.setup
+            self._setup_is_async = asyncio.iscoroutinefunction(self._execute_setup)
 
         if self._execute_task is None:
             if self.use_async:
                 self._execute_task = self.task_async
             else:
                 self._execute_task = self.task
+            self._task_is_async = asyncio.iscoroutinefunction(self._execute_task)
+
+        if self._execute_closure is None:
+            self._execute_closure = self.closure
+            self._closure_is_async = asyncio.iscoroutinefunction(self._execute_closure)
+
+        # Check the log level once so disabled trace logging costs a single boolean read on the hot paths,
+        # and bind the logger so enabled tracing skips the dict lookup per call.
+        self._task_root_logger = root_logger = self.loggers.get("task_root")
+        self._trace_enabled = root_logger is not None and root_logger.isEnabledFor(logging.DEBUG)
 
         if self._execute_task_loop is None:
             # Change the task loop to async if the task is async
-            if asyncio.iscoroutinefunction(self._execute_task):
+            if self._task_is_async:
                 self._execute_task_loop = self.task_loop_async
             # Change the task loop to a normal method if the task is a normal method
             else:
                 self._execute_task_loop = self.task_loop
 
-        if self._execute_closure is None:
-            self._execute_closure = self.closure
+    # In-Flight Sends
+    async def _send_with_cleanup(self, name, item, **kwargs):
+        """Sends an item through an output, bounded by the in-flight semaphore, and cleans up after.
+
+        Args:
+            name (str): The name of the output to send the item through.
+            item: The item to send.
+        """
+        async with self._inflight:
+            try:
+                # The synchronous send can block on a full or slow output, so it runs in an executor
+                # rather than stalling the event loop and any same-loop consumer with it.
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, functools.partial(self.outputs.send_item, name, item, **kwargs))
+            finally:
+                self._inflight_count -= 1
+                if self._inflight_count == 0:
+                    self._drained.set()
+
+    def send_item_task(self, name, item, **kwargs):
+        """Fires an output send as a background asyncio task so the producer does not wait on the consumer.
+
+        At most max_inflight sends run concurrently; further sends queue on the semaphore. Use drain to
+        wait for all outstanding sends to finish.
+
+        Args:
+            name (str): The name of the output to send the item through.
+            item: The item to send.
+
+        Returns:
+            The asyncio task executing the send.
+        """
+        if self._inflight is None:
+            self._inflight = asyncio.Semaphore(self.max_inflight)
+            self._drained = asyncio.Event()
+            self._drained.set()
+        self._inflight_count += 1
+        self._drained.clear()
+        return asyncio.create_task(self._send_with_cleanup(name, item, **kwargs))
+
+    async def drain(self):
+        """Waits until every outstanding background send has finished."""
+        if self._drained is not None:
+            await self._drained.wait()
 
     # Section Execution
     def execute_setup(self, func_name="execute_setup", allow_setup=None, **kwargs):
@@ -459,10 +609,12 @@ class Task(ObjectWithLogging):
             self.setup_kwargs = kwargs
 
         if allow_setup:
-            self.trace_log("task_root", func_name, "running setup", name=self.name, level="DEBUG")
+            if self._trace_enabled:
+                self._task_root_logger.trace_log(type(self), func_name, "running setup", name=self.name, level="DEBUG")
             self._execute_setup(**self.setup_kwargs)
         else:
-            self.trace_log("task_root", func_name, "skipping setup", name=self.name, level="DEBUG")
+            if self._trace_enabled:
+                self._task_root_logger.trace_log(type(self), func_name, "skipping setup", name=self.name, level="DEBUG")
 
     def execute_closure(self, func_name="execute_closure", allow_closure=None, **kwargs):
         """Executes the _execute_closure function.
@@ -478,10 +630,12 @@ class Task(ObjectWithLogging):
             self.closure_kwargs = kwargs
 
         if allow_closure:
-            self.trace_log("task_root", func_name, "running closure", name=self.name, level="DEBUG")
+            if self._trace_enabled:
+                self._task_root_logger.trace_log(type(self), func_name, "running closure", name=self.name, level="DEBUG")
             self._execute_closure(**self.closure_kwargs)
         else:
-            self.trace_log("task_root", func_name, "skipping closure", name=self.name, level="DEBUG")
+            if self._trace_enabled:
+                self._task_root_logger.trace_log(type(self), func_name, "skipping closure", name=self.name, level="DEBUG")
 
     async def execute_setup_async(self, func_name="execute_setup_async", allow_setup=None, **kwargs):
         """Executes the _execute_setup function will async support.
@@ -497,14 +651,17 @@ class Task(ObjectWithLogging):
             self.setup_kwargs = kwargs
 
         if allow_setup:
-            if asyncio.iscoroutinefunction(self._execute_setup):
-                self.trace_log("task_root", func_name, "running async setup", name=self.name, level="DEBUG")
+            if self._setup_is_async:
+                if self._trace_enabled:
+                    self._task_root_logger.trace_log(type(self), func_name, "running async setup", name=self.name, level="DEBUG")
                 await self._execute_setup(**self.setup_kwargs)
             else:
-                self.trace_log("task_root", func_name, "running setup", name=self.name, level="DEBUG")
+                if self._trace_enabled:
+                    self._task_root_logger.trace_log(type(self), func_name, "running setup", name=self.name, level="DEBUG")
                 self._execute_setup(**self.setup_kwargs)
         else:
-            self.trace_log("task_root", func_name, "skipping setup", name=self.name, level="DEBUG")
+            if self._trace_enabled:
+                self._task_root_logger.trace_log(type(self), func_name, "skipping setup", name=self.name, level="DEBUG")
 
     async def execute_closure_async(self, func_name="execute_closure_async", allow_closure=None, **kwargs):
         """Executes the _execute_setup function will async support.
@@ -520,17 +677,20 @@ class Task(ObjectWithLogging):
             self.closure_kwargs = kwargs
 
         if allow_closure:
-            if asyncio.iscoroutinefunction(self._execute_closure):
-                self.trace_log("task_root", func_name, "running async closure", name=self.name, level="DEBUG")
+            if self._closure_is_async:
+                if self._trace_enabled:
+                    self._task_root_logger.trace_log(type(self), func_name, "running async closure", name=self.name, level="DEBUG")
                 await self._execute_closure(**self.closure_kwargs)
             else:
-                self.trace_log("task_root", func_name, "running closure", name=self.name, level="DEBUG")
+                if self._trace_enabled:
+                    self._task_root_logger.trace_log(type(self), func_name, "running closure", name=self.name, level="DEBUG")
                 self._execute_closure(**self.closure_kwargs)
         else:
-            self.trace_log("task_root", func_name, "skipping closure", name=self.name, level="DEBUG")
+            if self._trace_enabled:
+                self._task_root_logger.trace_log(type(self), func_name, "skipping closure", name=self.name, level="DEBUG")
 
     # Separate Process Execution
-    def _execute_process(self, method, asyn=None, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    def _execute_process(self, method, asyn=None, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Starts running a method from this object in separate process.
 
         Args:
@@ -548,10 +708,16 @@ class Task(ObjectWithLogging):
 
         if self.process is None:
             self.create_process()
-        self.set_process_method(method, kwargs=kwargs)
+
+        # Only rebuild the process target when the method or its kwargs changed since the last start, so
+        # repeated restarts reuse the prepared target instead of re-deriving it every time.
+        cache_key = (method, {key: value for key, value in kwargs.items()})
+        if self._process_setup_cache != cache_key:
+            self.set_process_method(method, kwargs=kwargs)
+            self._process_setup_cache = cache_key
         self.process.start()
 
-    async def _execute_process_async(self, method, asyn=None, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    async def _execute_process_async(self, method, asyn=None, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Asynchronously starts running a method from this object in separate process.
 
         Args:
@@ -564,7 +730,7 @@ class Task(ObjectWithLogging):
         self._execute_process(method, asyn, s_kwargs, t_kwargs, c_kwargs)
 
     # Normal Execution
-    def run_normal(self, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    def run_normal(self, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Executes a single run of the task with setup and closure.
 
         Args:
@@ -572,12 +738,18 @@ class Task(ObjectWithLogging):
             t_kwargs (dict): The keyword arguments for the task.
             c_kwargs (dict): The keyword arguments for the closure.
         """
+        # Resolve omitted kwargs to the shared empty mapping instead of allocating new dicts.
+        s_kwargs = s_kwargs or self._EMPTY
+        t_kwargs = t_kwargs or self._EMPTY
+        c_kwargs = c_kwargs or self._EMPTY
+
         # Set async
         self._is_async = False
 
         # Flag On
         if not self.alive_event.is_set():
             self.alive_event.set()
+        self.done_event.clear()
 
         # Set execute methods
         self.prepare()
@@ -588,7 +760,8 @@ class Task(ObjectWithLogging):
         # Run Task Loop
         if t_kwargs:
             self.task_kwargs = t_kwargs
-        self.trace_log("task_root", "run_normal", "running task", name=self.name, level="DEBUG")
+        if self._trace_enabled:
+            self._task_root_logger.trace_log(type(self), "run_normal", "running task", name=self.name, level="DEBUG")
         self._execute_task(**self.task_kwargs)
 
         # Optionally run Closure
@@ -596,8 +769,9 @@ class Task(ObjectWithLogging):
 
         # Flag Off
         self.alive_event.clear()
+        self.done_event.set()
 
-    def start_normal(self, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    def start_normal(self, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Starts the continuous execution of the task with setup and closure.
 
         Args:
@@ -605,12 +779,18 @@ class Task(ObjectWithLogging):
             t_kwargs (dict): The keyword arguments for the task.
             c_kwargs (dict): The keyword arguments for the closure.
         """
+        # Resolve omitted kwargs to the shared empty mapping instead of allocating new dicts.
+        s_kwargs = s_kwargs or self._EMPTY
+        t_kwargs = t_kwargs or self._EMPTY
+        c_kwargs = c_kwargs or self._EMPTY
+
         # Set async
         self._is_async = False
 
         # Flag On
         if not self.alive_event.is_set():
             self.alive_event.set()
+        self.done_event.clear()
 
         # Set execute methods
         self.prepare()
@@ -621,7 +801,8 @@ class Task(ObjectWithLogging):
         # Run Task Loop
         if t_kwargs:
             self.task_kwargs = t_kwargs
-        self.trace_log("task_root", "start_normal", "running task", name=self.name, level="DEBUG")
+        if self._trace_enabled:
+            self._task_root_logger.trace_log(type(self), "start_normal", "running task", name=self.name, level="DEBUG")
         self._execute_task_loop(**self.task_kwargs)
 
         # Optionally run Closure
@@ -629,9 +810,10 @@ class Task(ObjectWithLogging):
 
         # Flag Off
         self.alive_event.clear()
+        self.done_event.set()
 
     # Async Execution
-    async def run_coro(self, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    async def run_coro(self, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Executes a single run of the async task with setup and closure.
 
         Args:
@@ -639,12 +821,18 @@ class Task(ObjectWithLogging):
             t_kwargs (dict): The keyword arguments for the task.
             c_kwargs (dict): The keyword arguments for the closure.
         """
+        # Resolve omitted kwargs to the shared empty mapping instead of allocating new dicts.
+        s_kwargs = s_kwargs or self._EMPTY
+        t_kwargs = t_kwargs or self._EMPTY
+        c_kwargs = c_kwargs or self._EMPTY
+
         # Set async
         self._is_async = True
 
         # Flag On
         if not self.alive_event.is_set():
             self.alive_event.set()
+        self.done_event.clear()
 
         # Set execute methods
         self.prepare()
@@ -655,11 +843,13 @@ class Task(ObjectWithLogging):
         # Run Task
         if t_kwargs:
             self.task_kwargs = t_kwargs
-        if asyncio.iscoroutinefunction(self._execute_task):
-            self.trace_log("task_root", "run_coro", "running async task", name=self.name, level="DEBUG")
+        if self._task_is_async:
+            if self._trace_enabled:
+                self._task_root_logger.trace_log(type(self), "run_coro", "running async task", name=self.name, level="DEBUG")
             await self._execute_task(**self.task_kwargs)
         else:
-            self.trace_log("task_root", "run_coro", "running task", name=self.name, level="DEBUG")
+            if self._trace_enabled:
+                self._task_root_logger.trace_log(type(self), "run_coro", "running task", name=self.name, level="DEBUG")
             self._execute_task(**self.task_kwargs)
 
         # Optionally run Closure
@@ -667,8 +857,9 @@ class Task(ObjectWithLogging):
 
         # Flag Off
         self.alive_event.clear()
+        self.done_event.set()
 
-    async def start_coro(self, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    async def start_coro(self, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Starts the continuous async execution of the task with setup and closure.
 
         Args:
@@ -676,12 +867,18 @@ class Task(ObjectWithLogging):
             t_kwargs (dict): The keyword arguments for the task.
             c_kwargs (dict): The keyword arguments for the closure.
         """
+        # Resolve omitted kwargs to the shared empty mapping instead of allocating new dicts.
+        s_kwargs = s_kwargs or self._EMPTY
+        t_kwargs = t_kwargs or self._EMPTY
+        c_kwargs = c_kwargs or self._EMPTY
+
         # Set async
         self._is_async = True
 
         # Flag On
         if not self.alive_event.is_set():
             self.alive_event.set()
+        self.done_event.clear()
 
         # Set execute methods
         self.prepare()
@@ -692,11 +889,13 @@ class Task(ObjectWithLogging):
         # Run Task Loop
         if t_kwargs:
             self.task_kwargs = t_kwargs
-        if asyncio.iscoroutinefunction(self._execute_task):
-            self.trace_log("task_root", "start_coro", "running async task", name=self.name, level="DEBUG")
+        if self._task_is_async:
+            if self._trace_enabled:
+                self._task_root_logger.trace_log(type(self), "start_coro", "running async task", name=self.name, level="DEBUG")
             await self._execute_task_loop(**self.task_kwargs)
         else:
-            self.trace_log("task_root", "start_coro", "running task", name=self.name, level="DEBUG")
+            if self._trace_enabled:
+                self._task_root_logger.trace_log(type(self), "start_coro", "running task", name=self.name, level="DEBUG")
             self._execute_task_loop(**self.task_kwargs)
 
         # Optionally run Closure
@@ -704,6 +903,7 @@ class Task(ObjectWithLogging):
 
         # Flag Off
         self.alive_event.clear()
+        self.done_event.set()
 
     # Joins
     def join_normal(self, timeout=None):
@@ -715,31 +915,25 @@ class Task(ObjectWithLogging):
         if self.is_process:
             self.process.join(timeout)
         else:
-            start_time = time.perf_counter()
-            while self.alive_event.is_set():
-                if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn(TimeoutWarning("'join_normal'"), stacklevel=2)
-                    return
+            if not self.done_event.wait(timeout):
+                warnings.warn(TimeoutWarning("'join_normal'"), stacklevel=2)
 
     async def join_async(self, timeout=None, interval=0.0):
         """Asynchronously wait until this object terminates.
 
         Args:
             timeout (float): The time in seconds to wait for termination.
-            interval (float): The time in seconds between termination checks. Zero means it will check ASAP.
+            interval (float): Kept for API compatibility, the event wait does not poll.
         """
         if self.is_process:
             await self.process.join_async(timeout, interval)
         else:
-            start_time = time.perf_counter()
-            while self.alive_event.is_set():
-                await asyncio.sleep(interval)
-                if timeout is not None and (time.perf_counter() - start_time) >= timeout:
-                    warnings.warn(TimeoutWarning("'join_async'"), stacklevel=2)
-                    return
+            loop = asyncio.get_event_loop()
+            if not await loop.run_in_executor(None, self.done_event.wait, timeout):
+                warnings.warn(TimeoutWarning("'join_async'"), stacklevel=2)
 
     # Full Execution
-    def run(self, process=None, asyn=None, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    def run(self, process=None, asyn=None, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Executes a single run of the task and determines if the async version should be run.
 
         Args:
@@ -765,7 +959,7 @@ class Task(ObjectWithLogging):
         else:
             self.run_normal(s_kwargs, t_kwargs, c_kwargs)
 
-    def run_async_task(self, process=None, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    def run_async_task(self, process=None, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Creates a single execution of this task as an asyncio task.
 
         Args:
@@ -773,6 +967,10 @@ class Task(ObjectWithLogging):
             s_kwargs (dict): The keyword arguments for the setup.
             t_kwargs (dict): The keyword arguments for the task.
             c_kwargs (dict): The keyword arguments for the closure.
+
+        Returns:
+            :obj:`asyncio.Task`: The scheduled execution, already a future on the running loop so
+                asyncio.gather can take it as is without a coroutine wrapping pass.
         """
         # Set separate process
         if process is not None:
@@ -780,6 +978,7 @@ class Task(ObjectWithLogging):
 
         # Flag On
         self.alive_event.set()
+        self.done_event.clear()
 
         # Create Async Event
         if self._is_process:
@@ -790,7 +989,7 @@ class Task(ObjectWithLogging):
 
             return asyncio.create_task(self.run_coro(s_kwargs, t_kwargs, c_kwargs))
 
-    def start(self, process=None, asyn=None, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    def start(self, process=None, asyn=None, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Starts the execution of multiple runs of the task and determines if the async version should be run.
 
         Args:
@@ -816,7 +1015,7 @@ class Task(ObjectWithLogging):
         else:
             self.start_normal(s_kwargs, t_kwargs, c_kwargs)
 
-    def start_async_task(self, process=None, s_kwargs={}, t_kwargs={}, c_kwargs={}):
+    def start_async_task(self, process=None, s_kwargs=None, t_kwargs=None, c_kwargs=None):
         """Creates the continuous execution of this task as an asyncio task.
 
         Args:
@@ -824,6 +1023,10 @@ class Task(ObjectWithLogging):
             s_kwargs (dict): The keyword arguments for the setup.
             t_kwargs (dict): The keyword arguments for the task.
             c_kwargs (dict): The keyword arguments for the closure.
+
+        Returns:
+            :obj:`asyncio.Task`: The scheduled execution, already a future on the running loop so
+                asyncio.gather can take it as is without a coroutine wrapping pass.
         """
         # Set separate process
         if process is not None:
@@ -831,6 +1034,7 @@ class Task(ObjectWithLogging):
 
         # Flag On
         self.alive_event.set()
+        self.done_event.clear()
 
         # Create Async Event
         if self._is_process:
@@ -897,6 +1101,12 @@ class Task(ObjectWithLogging):
         """
         self.trace_log("task_root", "terminate", "terminate was called", name=self.name, level="DEBUG")
         self.terminate_event.set()
+        # Wake the async task loop immediately rather than letting it finish its current wait.
+        if self._stop_event is not None and self._stop_loop is not None:
+            try:
+                self._stop_loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:  # The loop is already closed, the terminate flag alone suffices.
+                pass
         self.inputs.stop_all()
         self.outputs.stop_all()
         if join:
@@ -906,6 +1116,27 @@ class Task(ObjectWithLogging):
         """Resets the stop flag to allow this task to run again."""
         self.terminate_event.clear()
 
+    def close(self):
+        """Stops this task and closes its separate process, freeing its resources."""
+        # The getattr guards keep teardown safe on partially constructed objects.
+        if getattr(self, "alive_event", None) is not None and self.is_alive():
+            self.terminate()
+        if getattr(self, "process", None) is not None:
+            self.process.close()
+
+    # Context Managers
+    def __enter__(self):
+        """Enters a context block, returning this object."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exits a context block, stopping this task and closing its process."""
+        self.close()
+
+    def __del__(self):
+        """Closes this task's process when this object is deleted."""
+        self.close()
+
 
 @dataclasses.dataclass
 class TaskUnit:
@@ -949,6 +1180,9 @@ class MultiUnitTask(Task):
 
         _execution_order (:obj:`tuple` of :obj:`str`): The order to execute the contained units.
         units (:obj:`dict` of :obj:`TaskUnit`): The contained Tasks to execute by name.
+        use_pool (bool): Determines if the units will be executed through the shared worker pool.
+        _pool (:obj:`Pool`): The lazily created worker pool shared by all unit executions.
+        _pending (:obj:`list` of :obj:`AsyncResult`): The results of unit runs dispatched to the pool.
 
     Args:
         units :obj:`dict` of :obj:`TaskUnit`): The contained Tasks to execute by name.
@@ -963,7 +1197,7 @@ class MultiUnitTask(Task):
     """
     # Construction/Destruction
     def __init__(self, name=None, units={}, order=(),
-                 allow_setup=True, allow_closure=True, s_kwargs={}, t_kwargs={}, c_kwargs={}, init=True):
+                 allow_setup=True, allow_closure=True, s_kwargs=None, t_kwargs=None, c_kwargs=None, init=True):
         # Run Parent __init__ but only construct in child
         super().__init__(init=False)
 
@@ -972,6 +1206,10 @@ class MultiUnitTask(Task):
 
         self.units = {}
 
+        self.use_pool = False
+        self._pool = None
+        self._pending = []
+
         # Optionally Construct this object
         if init:
             self.construct(units=units, order=order, name=name, allow_setup=allow_setup, allow_closure=allow_closure,
@@ -995,6 +1233,43 @@ class MultiUnitTask(Task):
         else:
             raise IndexError("the execution order must contain all the units")
 
+    @property
+    def pool(self):
+        """:obj:`Pool`: The shared worker pool, created lazily on first access.
+
+        The pool is created once and reused by every pooled execution, amortizing the process spawn cost.
+        Workers are recycled periodically to bound memory growth from long lived children.
+        """
+        if self._pool is None:
+            self._pool = SeparateProcess.CTX.Pool(processes=SeparateProcess.cpu_count(), maxtasksperchild=1000)
+        return self._pool
+
+    # Context Managers
+    def __enter__(self):
+        """Enters a context block, returning this object."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exits a context block, closing the worker pool."""
+        self.close_pool()
+
+    def __del__(self):
+        """Closes the worker pool when this object is deleted."""
+        self.close_pool()
+
+    # Pickling
+    def __getstate__(self):
+        """Creates a dictionary of attributes which can be used to rebuild this object.
+
+        Returns:
+            dict: A dictionary of this object's attributes.
+        """
+        out_dict = super().__getstate__()
+        # The pool and its pending results cannot cross process boundaries, the child gets a fresh pool.
+        out_dict["_pool"] = None
+        out_dict["_pending"] = []
+        return out_dict
+
     # Container Methods
     def __len__(self):
         """The number of units this object has.
@@ -1146,6 +1421,10 @@ class MultiUnitTask(Task):
     # Task
     def task(self, **kwargs):
         """The main method to execute the contained units."""
+        if self.use_pool:
+            self.run_units_pool()
+            return
+
         # Execute all of the units
         for name in self.execution_order:
             unit = self.units[name]
@@ -1154,10 +1433,44 @@ class MultiUnitTask(Task):
             else:
                 unit.obj.run()
 
+    # Pool Execution
+    def run_units_pool(self):
+        """Dispatches the contained units to the shared worker pool instead of spawning a process per unit.
+
+        The pool hands units to idle workers as they free up, so uneven unit runtimes balance across workers.
+        """
+        for name in self.execution_order:
+            unit = self.units[name]
+            method = "start" if unit.execute_type == "start" else "run"
+            self._pending.append(
+                self.pool.apply_async(run_pool_unit, (type(unit.obj), unit.obj.pool_state(), method)))
+
+    def join_pool(self, timeout=None):
+        """Wait for all unit runs dispatched to the pool to finish, re-raising any unit failure.
+
+        Args:
+            timeout (float): The time in seconds to wait for each pending unit run.
+        """
+        pending = self._pending
+        self._pending = []
+        for result in pending:
+            result.get(timeout)
+
+    def close_pool(self):
+        """Closes the worker pool and reclaims its resources."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
     async def task_async(self):
-        """The main async method to execute the contained units."""
+        """The main async method to execute the contained units.
+
+        Every unit is dispatched concurrently, async units as tasks on the event loop and sync units
+        through the loop's executor, so independent units run in parallel rather than serially.
+        """
+        loop = asyncio.get_event_loop()
         async_tasks = []
-        sequential_executions = []
 
         # Create objects to execute
         for name in self.execution_order:
@@ -1167,17 +1480,14 @@ class MultiUnitTask(Task):
                 if obj.is_async:
                     async_tasks.append(obj.start_async_task())
                 else:
-                    sequential_executions.append(obj.start)
+                    async_tasks.append(loop.run_in_executor(None, obj.start))
             else:
                 if obj.is_async:
                     async_tasks.append(obj.run_async_task())
                 else:
-                    sequential_executions.append(obj.run)
+                    async_tasks.append(loop.run_in_executor(None, obj.run))
 
         # Execute all of the units
-        for execute in sequential_executions:
-            execute()
-
         await asyncio.gather(*async_tasks)
 
     # Closure
@@ -15,7 +15,11 @@ __status__ = "Prototype"
 # Default Libraries #
 import asyncio
 import dataclasses
+import logging
 from multiprocessing import Process, Pool, Lock, Event, Queue, Pipe
+import os
+import queue
+import threading
 import warnings
 import time
 import typing
@@ -30,6 +34,94 @@ from .task import Task
 
 # Definitions #
 # Classes #
+# Handlers #
+class AsyncBufferedFileHandler(logging.Handler):
+    """A file handler that queues records and writes them to the file in batches off-thread.
+
+    emit only formats the record and appends it to an internal queue, so the logging call returns
+    without touching the file or waiting on its lock. A daemon thread drains the queue and writes the
+    gathered records with one writev once batch_bytes have accumulated or flush_interval passes with
+    no new records, turning many small per-record writes into a few large ones.
+
+    Attributes:
+        baseFilename (str): The path of the log file.
+        batch_bytes (int): The buffered size in bytes that triggers a write.
+        flush_interval (float): The most seconds a record waits in the buffer before being written.
+
+    Args:
+        filename: The path of the log file.
+        batch_bytes (int, optional): The buffered size in bytes that triggers a write.
+        flush_interval (float, optional): The most seconds a record waits before being written.
+    """
+    # Construction/Destruction
+    def __init__(self, filename, batch_bytes=64 * 1024, flush_interval=0.25):
+        super().__init__()
+        self.baseFilename = str(filename)
+        self.batch_bytes = batch_bytes
+        self.flush_interval = flush_interval
+        self.terminator = "\n"
+        self._queue = queue.SimpleQueue()
+        self._fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    # Methods
+    def emit(self, record):
+        """Formats the record and queues it for the flusher thread instead of writing it here."""
+        try:
+            self._queue.put((self.format(record) + self.terminator).encode())
+        except Exception:
+            self.handleError(record)
+
+    def _flush_loop(self):
+        """Drains the record queue, batching the writes by size and by time."""
+        buffers = []
+        size = 0
+        while not self._stop_flushing.is_set() or not self._queue.empty():
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            if isinstance(item, threading.Event):
+                # A flush handshake, write what is pending and wake the flush call.
+                if buffers:
+                    os.writev(self._fd, buffers)
+                    buffers.clear()
+                    size = 0
+                item.set()
+                continue
+            if item is not None:
+                buffers.append(item)
+                size += len(item)
+            if buffers and (item is None or size >= self.batch_bytes):
+                os.writev(self._fd, buffers)
+                buffers.clear()
+                size = 0
+        if buffers:
+            os.writev(self._fd, buffers)
+
+    def flush(self):
+        """Blocks until every record queued before this call is written to the file.
+
+        Sends an event through the record queue and waits for the flusher thread to write the pending
+        batch and set it, so returning means the records are in the file rather than in a buffer.
+        """
+        if not self._flusher.is_alive() or threading.current_thread() is self._flusher:
+            return
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        while not flushed.wait(self.flush_interval) and self._flusher.is_alive():
+            pass
+
+    def close(self):
+        """Stops the flusher thread, writes any remaining records, and closes the file."""
+        self._stop_flushing.set()
+        self._flusher.join(self.flush_interval * 4)
+        os.close(self._fd)
+        super().close()
+
+
 # Tasks #
 @dataclasses.dataclass
 class ListenerUnit:
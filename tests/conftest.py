@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" conftest.py
+Description: Shared pytest fixtures for the processingblocks tests.
+"""
+__author__ = "Anthony Fong"
+__copyright__ = "Copyright 2021, Anthony Fong"
+__credits__ = ["Anthony Fong"]
+__license__ = ""
+__version__ = "0.1.0"
+__maintainer__ = "Anthony Fong"
+__email__ = ""
+__status__ = "Prototype"
+
+# Default Libraries #
+import asyncio
+
+# Downloaded Libraries #
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # uvloop is an optional accelerator, the default loop works everywhere.
+    uvloop = None
+
+
+# Definitions #
+# Functions #
+@pytest.fixture(scope="session")
+def event_loop():
+    """A single event loop shared across the test session instead of one per asyncio.run call.
+
+    Uses uvloop's loop when the package is installed, otherwise the default selector loop.
+    """
+    loop = asyncio.new_event_loop() if uvloop is None else uvloop.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
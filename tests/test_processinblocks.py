@@ -13,9 +13,14 @@ __email__ = ""
 __status__ = "Prototype"
 
 # Default Libraries #
+import array
 import asyncio
+import functools
+import os
 import pathlib
 import pickle
+import queue
+import threading
 import time
 import timeit
 
@@ -23,11 +28,20 @@ import timeit
 import advancedlogging
 import pytest
 
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator, the pure Python loop is the fallback.
+    njit = None
+
 # Local Libraries #
 import src.processingblocks as processingblocks
 
 
 # Definitions #
+_HANDLER_CACHE = {}
+_HANDLER_LOCK = threading.Lock()
+
+
 # Functions #
 @pytest.fixture
 def tmp_dir(tmpdir):
@@ -35,6 +49,66 @@ def tmp_dir(tmpdir):
     return pathlib.Path(tmpdir)
 
 
+def add_file_handler(logger, path):
+    """Attaches the default file handler for a path to a logger once, reusing handlers across tests.
+
+    Args:
+        logger (:obj:`AdvancedLogger`): The logger to attach the file handler to.
+        path (:obj:`Path`): The path of the log file.
+    """
+    path = pathlib.Path(path)
+    if any(getattr(h, "baseFilename", "") == str(path) for h in logger.handlers):
+        return
+    with _HANDLER_LOCK:
+        handler = _HANDLER_CACHE.get(path)
+        if handler is None:
+            logger.add_default_file_handler(path)
+            _HANDLER_CACHE[path] = logger.handlers[-1]
+        else:
+            logger.addHandler(handler)
+
+
+def _process_batch(batch):
+    """Sums a batch of produced integers, the numeric body of the consumer stage.
+
+    Compiled with numba when it is installed; array.array reaches nopython mode through the buffer
+    protocol. Run it in an executor so the compiled loop releases the GIL off the event loop.
+
+    Args:
+        batch: The contiguous batch of integers to process.
+
+    Returns:
+        int: The sum of the batch.
+    """
+    total = 0
+    for value in batch:
+        total += value
+    return total
+
+
+if njit is not None:
+    _process_batch = njit(cache=True)(_process_batch)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_log_cached(path_str, mtime_ns):
+    """Reads and splits a log file's bytes, cached until the file's mtime changes.
+
+    Args:
+        path_str (str): The path of the log file.
+        mtime_ns (int): The file's modification time, which keys the cache to the file's contents.
+
+    Returns:
+        list of bytes: The lines of the log file.
+    """
+    return pathlib.Path(path_str).read_bytes().splitlines()
+
+
+def ctrl_relay(process, result_queue):
+    """Forwards a control channel message to a queue, run inside the child process."""
+    result_queue.put(process.recv_ctrl(timeout=5))
+
+
 def log(logger, level):
     log_class_ = "separate"
     log_func = "test_trace_log"
@@ -52,9 +126,8 @@ class ClassTest:
 
     def get_log_lines(self, tmp_dir, logger_name):
         path = tmp_dir.joinpath(f"{logger_name}.log")
-        with path.open() as f_object:
-            lines = f_object.readlines()
-        return lines
+        raw_lines = _read_log_cached(str(path), os.stat(path).st_mtime_ns)
+        return [line.decode() for line in raw_lines]
 
 
 class TestSeparateProcess(ClassTest):
@@ -67,12 +140,63 @@ class TestSeparateProcess(ClassTest):
 
         logger = advancedlogging.AdvancedLogger(logger_name)
         logger.setLevel(level)
-        logger.add_default_file_handler(path)
+        add_file_handler(logger, path)
 
         obj = processingblocks.SeparateProcess(target=log, kwargs={"logger": logger, "level": level})
-        pickle_jar = pickle.dumps(obj)
-        new_obj = pickle.loads(pickle_jar)
+        buffers = []
+        pickle_jar = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        new_obj = pickle.loads(pickle_jar, buffers=[b.raw() for b in buffers])
         assert set(dir(new_obj)) == set(dir(obj))
+        assert new_obj.kwargs["logger"].name == logger_name
+
+    def test_fork_start(self, tmp_dir):
+        logger_name = "separate"
+        level = "INFO"
+        path = tmp_dir.joinpath(f"{logger_name}.log")
+
+        logger = advancedlogging.AdvancedLogger(logger_name)
+        logger.setLevel(level)
+        add_file_handler(logger, path)
+
+        process = processingblocks.SeparateProcess(target=log, kwargs={"logger": logger, "level": level})
+        start = time.perf_counter()
+        process.start()
+        latency = time.perf_counter() - start
+        process.join()
+
+        print(f"\nProcess start latency: {latency * 1000:.3f} ms")
+        assert not process.is_alive()
+
+    def test_ctrl_channel(self):
+        if processingblocks.SeparateProcess.CTX.get_start_method() != "fork":
+            pytest.skip("the control channel requires the fork start method")
+
+        process = processingblocks.SeparateProcess(delay=True)
+        result_queue = processingblocks.SeparateProcess.CTX.Queue()
+        process.create_process(target=ctrl_relay, args=(process, result_queue))
+
+        process.send_ctrl(b"ping")
+        process.start()
+        assert result_queue.get(timeout=5) == b"ping"
+        process.join()
+
+    def test_specialize(self, tmp_dir):
+        logger_name = "separate"
+        level = "INFO"
+        path = tmp_dir.joinpath(f"{logger_name}.log")
+
+        logger = advancedlogging.AdvancedLogger(logger_name)
+        logger.setLevel(level)
+        add_file_handler(logger, path)
+
+        process = processingblocks.SeparateProcess(target=log, kwargs={"logger": logger, "level": level})
+        process.specialize()
+        assert process.kwargs == {}
+
+        process.start()
+        assert process.done_event.wait(timeout=5)
+        process.join()
+        assert not process.is_alive()
 
     def test_separate_process(self, tmp_dir):
         # Setup
@@ -82,13 +206,14 @@ class TestSeparateProcess(ClassTest):
 
         logger = advancedlogging.AdvancedLogger(logger_name)
         logger.setLevel(level)
-        logger.add_default_file_handler(path)
+        add_file_handler(logger, path)
 
         process = processingblocks.SeparateProcess(target=log, kwargs={"logger": logger, "level": level}, delay=True)
         process.construct()
         process.start()
 
-        time.sleep(3)
+        assert process.done_event.wait(timeout=5)
+        process.join()
 
         assert not process.is_alive()
 
@@ -99,6 +224,133 @@ class TestSeparateProcess(ClassTest):
         assert level in lines[0]
 
 
+class TestWorkStealingScheduler(ClassTest):
+    class_ = processingblocks.WorkStealingScheduler
+
+    def test_seed_pop(self):
+        scheduler = self.class_(workers=4)
+        scheduler.seed(range(8))
+        assert len(scheduler) == 8
+
+        # Round-robin seeding puts two items per worker and the owner pops its newest first.
+        assert scheduler.pop(0) == 4
+        assert scheduler.pop(0) == 0
+        assert scheduler.pop(0) is None
+
+    def test_steal(self):
+        scheduler = self.class_(workers=2)
+        scheduler.push(0, 1)
+        scheduler.push(0, 2)
+
+        # The idle worker steals the victim's oldest item, not its newest.
+        assert scheduler.steal(1) == 1
+        assert scheduler.get(1) == 2
+        assert scheduler.steal(1) is None
+        assert scheduler.get(1) is None
+
+    def test_worker_loop(self):
+        workers = 4
+        scheduler = self.class_(workers=workers)
+        scheduler.seed(range(100))
+        executed = []
+        executed_lock = threading.Lock()
+
+        def execute(item):
+            with executed_lock:
+                executed.append(item)
+
+        threads = [threading.Thread(target=scheduler.worker_loop, args=(worker, execute))
+                   for worker in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert len(scheduler) == 0
+        assert sorted(executed) == list(range(100))
+
+
+class TestLocalQueue(ClassTest):
+    class_ = processingblocks.LocalQueue
+
+    def test_put_get(self, event_loop):
+        asyncio.set_event_loop(event_loop)
+        local_queue = self.class_(maxsize=2)
+
+        local_queue.put(1)
+        local_queue.put(2)
+        with pytest.raises(queue.Full):
+            local_queue.put(3)
+
+        assert local_queue.get() == 1
+        assert local_queue.get() == 2
+        with pytest.raises(queue.Empty):
+            local_queue.get()
+
+    def test_blocking_refused(self, event_loop):
+        asyncio.set_event_loop(event_loop)
+        local_queue = self.class_()
+
+        with pytest.raises(ValueError):
+            local_queue.put(1, block=True)
+        with pytest.raises(ValueError):
+            local_queue.get(block=True)
+
+    def test_through_handlers(self, event_loop):
+        asyncio.set_event_loop(event_loop)
+        local_queue = self.class_()
+        outputs = processingblocks.OutputsHandler()
+        inputs = processingblocks.InputsHandler()
+        outputs.add_queue("Local", local_queue)
+        inputs.add_queue("Local", local_queue)
+
+        outputs.send_item("Local", 1)
+        assert inputs.get_item("Local") == 1
+        assert inputs.get_item("Local") is None
+
+        async def temp_run():
+            outputs.send_item("Local", 2)
+            return await inputs.get_item_wait_async("Local", timeout=5)
+
+        assert event_loop.run_until_complete(temp_run()) == 2
+
+    def test_put_get_async(self, event_loop):
+        asyncio.set_event_loop(event_loop)
+        local_queue = self.class_(maxsize=1)
+
+        async def temp_run():
+            await local_queue.put_async(1)
+            putter = asyncio.create_task(local_queue.put_async(2))
+            assert await local_queue.get_async(timeout=5) == 1
+            await putter
+            assert await local_queue.get_async(timeout=5) == 2
+
+        event_loop.run_until_complete(temp_run())
+
+
+class TestOutputsHandler(ClassTest):
+    class_ = processingblocks.OutputsHandler
+
+    def test_send_items(self, event_loop):
+        asyncio.set_event_loop(event_loop)
+        outputs = self.class_()
+        inputs = processingblocks.InputsHandler()
+        local_queue = processingblocks.LocalQueue()
+        outputs.add_queue("Batch", local_queue)
+        inputs.add_queue("Batch", local_queue)
+
+        async def temp_run():
+            outputs.send_items("Batch", range(10))
+            return await inputs.get_batch_wait_async("Batch", max_n=64, max_wait=5)
+
+        assert event_loop.run_until_complete(temp_run()) == list(range(10))
+
+    def test_send_items_unknown_output(self):
+        outputs = self.class_()
+        with pytest.warns(UserWarning):
+            outputs.send_items("Missing", [1])
+
+
 class BaseTaskTest(ClassTest):
     class ProduceTask(processingblocks.Task):
         log_path = None
@@ -106,48 +358,87 @@ class BaseTaskTest(ClassTest):
         def __init__(self, **kwargs):
             super().__init__(**kwargs)
             self.number = 0
+            self.batch_size = 8
 
         def build_loggers(self):
             logger = advancedlogging.AdvancedLogger("TaskTest")
             logger.setLevel("DEBUG")
-            logger.add_default_file_handler(self.log_path)
+            if not any(getattr(h, "baseFilename", "") == str(self.log_path) for h in logger.handlers):
+                logger.addHandler(processingblocks.AsyncBufferedFileHandler(self.log_path))
             self.loggers["TaskTest"] = logger
-            self.class_loggers["task_root"].add_default_file_handler(self.log_path)
+            add_file_handler(self.class_loggers["task_root"], self.log_path)
             self.class_loggers["task_root"].setLevel("DEBUG")
 
         def create_io(self):
-            self.outputs.create_queue("RawOut")
+            self.outputs.add_queue("RawOut", processingblocks.SharedMemoryQueue(slots=1024, slot_size=256))
 
         def setup(self):
             self.trace_log("TaskTest", "setup", "Success!")
 
         async def task_async(self):
-            item = self.number
-            self.trace_log("TaskTest", "task_async", f"Producing an item {item}")
-            self.outputs.send_item("RawOut", item)
-            self.trace_log("TaskTest", "task_async", "Item sent")
-            self.number += 1
-            await asyncio.sleep(2)
+            batch = array.array("q", range(self.number, self.number + self.batch_size))
+            self.number += self.batch_size
+            self.trace_log("TaskTest", "task_async", f"Producing batch {batch.tolist()}")
+            self.outputs.send_item("RawOut", batch)
+            self.trace_log("TaskTest", "task_async", "Batch sent")
+            await asyncio.sleep(0.1)
 
     class ModifyTask(processingblocks.Task):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.received = 0
+            self.received_condition = None
+
         def build_loggers(self):
             logger = advancedlogging.AdvancedLogger("TaskTest")
             logger.setLevel("DEBUG")
             self.loggers["TaskTest"] = logger
 
         def link_inputs(self, producer):
-            self.inputs.add_queue("RawInput", producer.outputs["RawOut"])
+            self.inputs.add_buffered_queue("RawInput", producer.outputs["RawOut"], maxsize=2 * self.max_inflight)
+
+        def _get_received_condition(self):
+            """Creates the condition on first use so it binds to the loop running the task.
+
+            On Python 3.8/3.9 asyncio primitives bind the event loop at construction, and this task
+            may run under a different loop than the one current when it was constructed.
+            """
+            if self.received_condition is None:
+                self.received_condition = asyncio.Condition()
+            return self.received_condition
 
         async def task_async(self):
-            thing = await self.inputs.get_item_wait_async("RawInput")
-            if thing is None:
-                return
-            self.trace_log("TaskTest", "task_async", f"Item Received {thing}")
-            await asyncio.sleep(2)
+            batches = await self.inputs.get_batch_wait_async("RawInput", max_n=64, max_wait=0.5)
+            loop = asyncio.get_running_loop()
+            count = 0
+            for batch in batches:
+                total = await loop.run_in_executor(None, _process_batch, batch)
+                self.trace_log("TaskTest", "task_async", f"Batch Received sum {total}")
+                count += len(batch)
+            if count:
+                condition = self._get_received_condition()
+                async with condition:
+                    self.received += count
+                    condition.notify_all()
+
+        async def wait_received(self, count, timeout=30):
+            """Waits until at least count items have been received, failing rather than hanging.
+
+            Args:
+                count (int): The number of received items to wait for.
+                timeout (float, optional): The most seconds to wait before the test fails.
+            """
+            condition = self._get_received_condition()
+
+            async def wait():
+                async with condition:
+                    await condition.wait_for(lambda: self.received >= count)
+
+            await asyncio.wait_for(wait(), timeout)
 
 
 class TestTask(BaseTaskTest):
-    def test_task(self, tmp_dir):
+    def test_task(self, tmp_dir, event_loop):
         logger_name = "task_separate"
         path = tmp_dir.joinpath(f"{logger_name}.log")
         self.ProduceTask.log_path = path
@@ -157,7 +448,7 @@ class TestTask(BaseTaskTest):
         modify_unit.link_inputs(produce_unit)
 
         async def stop():
-            await asyncio.sleep(10)
+            await modify_unit.wait_received(24)
             produce_unit.terminate()
             modify_unit.terminate()
 
@@ -169,10 +460,24 @@ class TestTask(BaseTaskTest):
             await asyncio.gather(pro_a_task, mod_a_task, stop_task)
             print("Success")
 
-        asyncio.run(temp_run())
+        event_loop.run_until_complete(temp_run())
         assert 1
 
-    def test_separate_process(self, tmp_dir):
+    def test_send_item_task(self, event_loop):
+        task = processingblocks.Task(name="SendTask")
+        out_queue = task.outputs.create_queue("Out")
+        count = 2 * task.max_inflight
+
+        async def temp_run():
+            for i in range(count):
+                task.send_item_task("Out", i)
+            await task.drain()
+
+        event_loop.run_until_complete(temp_run())
+        items = [out_queue.get(timeout=5) for _ in range(count)]
+        assert sorted(items) == list(range(count))
+
+    def test_separate_process(self, tmp_dir, event_loop):
         logger_name = "task_separate"
         path = tmp_dir.joinpath(f"{logger_name}.log")
         self.ProduceTask.log_path = path
@@ -185,7 +490,7 @@ class TestTask(BaseTaskTest):
 
         async def stop():
             assert produce_unit.is_processing()
-            await asyncio.sleep(10)
+            await modify_unit.wait_received(24)
             produce_unit.terminate()
             modify_unit.terminate()
 
@@ -197,22 +502,38 @@ class TestTask(BaseTaskTest):
             await asyncio.gather(pro_a_task, mod_a_task, stop_task)
             print("Success")
 
-        asyncio.run(temp_run())
+        event_loop.run_until_complete(temp_run())
         assert 1
 
 
 class TestMultiUnitTask(BaseTaskTest):
     class MultiUnitGroup(processingblocks.MultiUnitTask):
+        async def construct_units_async(self):
+            """Builds the member units concurrently, overlapping their file bound logger setup."""
+            loop = asyncio.get_running_loop()
+            produce_unit = TestMultiUnitTask.ProduceTask(init=False)
+            modify_unit = TestMultiUnitTask.ModifyTask(init=False)
+            stop_unit = processingblocks.Task(init=False)
+            await asyncio.gather(
+                loop.run_in_executor(None, produce_unit.construct, "ProduceTask"),
+                loop.run_in_executor(None, modify_unit.construct, "ModifyTask"),
+                loop.run_in_executor(None, stop_unit.construct, "Stop"),
+            )
+            return produce_unit, modify_unit, stop_unit
+
         def construct(self, units={}, order=(), **kwargs):
             super().construct(**kwargs)
-            produce_unit = TestMultiUnitTask.ProduceTask(name="ProduceTask")
-            modify_unit = TestMultiUnitTask.ModifyTask(name="ModifyTask")
-            stop_unit = processingblocks.Task(name="Stop")
+            loop = asyncio.new_event_loop()
+            try:
+                produce_unit, modify_unit, stop_unit = loop.run_until_complete(self.construct_units_async())
+            finally:
+                loop.close()
 
             async def stop():
-                await asyncio.sleep(10)
-                produce_unit.terminate()
-                modify_unit.terminate()
+                # Schedule the one-shot terminates as plain timer callbacks instead of sleeping here.
+                running_loop = asyncio.get_running_loop()
+                running_loop.call_later(10, produce_unit.terminate)
+                running_loop.call_later(10, modify_unit.terminate)
 
             produce_unit.is_async = True
             modify_unit.is_async = True
@@ -230,6 +551,22 @@ class TestMultiUnitTask(BaseTaskTest):
         block.run()
         assert 1
 
+    def test_pool_execution(self):
+        block = processingblocks.MultiUnitTask(name="PoolBlock")
+        unit_a = processingblocks.Task(name="A")
+        unit_b = processingblocks.Task(name="B")
+        unit_a.use_async = False
+        unit_b.use_async = False
+
+        block.set_unit("A", unit_a, "run")
+        block.set_unit("B", unit_b, "run")
+        block.use_pool = True
+
+        block.run_units_pool()
+        block.join_pool(timeout=30)
+        block.close_pool()
+        assert 1
+
 
 # Main #
 if __name__ == '__main__':